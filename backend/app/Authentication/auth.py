@@ -1,16 +1,35 @@
 from fastapi import Depends, HTTPException, status, Cookie, Request, Header
-from jose import JWTError, jwt
+from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from typing import Optional
 import logging
 
 from app.database.database import get_async_db
 from app.database.config import settings
 from app.models import User
+from app.Authentication.token_cache import verified_token_cache
+from app.services.user_cache import user_cache
+from app.services.token_revocation import revocation_list
 
 logger = logging.getLogger(__name__)
 
+# Claims written by AuthService.create_access_token
+_USER_CLAIMS = ("username", "permission", "role", "is_active")
+
+
+def _user_from_claims(user_id: int, payload: dict) -> Optional[User]:
+    """Detached User built from signed token claims (None if claims are missing)"""
+    if any(payload.get(claim) is None for claim in _USER_CLAIMS):
+        return None
+    
+    return User(
+        id=user_id,
+        username=payload["username"],
+        permission=payload["permission"],
+        role=payload["role"],
+        is_active=bool(payload["is_active"])
+    )
+
 
 async def get_current_user(
     request: Request,
@@ -21,11 +40,6 @@ async def get_current_user(
     """
     Validate JWT token from cookie or Authorization header and return current user
     """
-    logger.info("="*50)
-    logger.info("AUTH DEBUG INFO:")
-    logger.info(f"Authorization header: {authorization is not None}")
-    logger.info(f"Cookie jwt_auth_token: {jwt_auth_token is not None}")
-    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -36,14 +50,12 @@ async def get_current_user(
     
     # Try to get token from Authorization header
     if authorization:
-        logger.info(f"Processing Authorization header: {authorization[:50]}...")
         parts = authorization.split()
         
         if len(parts) == 2 and parts[0].lower() == "bearer":
             token = parts[1]
-            logger.info(f"✅ Extracted token from header")
         else:
-            logger.error(f"❌ Invalid Authorization format. Parts: {len(parts)}")
+            logger.warning("Invalid Authorization header format", extra={"parts": len(parts)})
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Invalid Authorization header format. Got {len(parts)} parts, expected 2"
@@ -52,59 +64,71 @@ async def get_current_user(
     # Try cookie if no header
     elif jwt_auth_token:
         token = jwt_auth_token
-        logger.info(f"✅ Using token from cookie")
     
     # No token found
     if not token:
-        logger.error("❌ No token found in header or cookie")
+        logger.debug("No token in Authorization header or cookie")
         raise credentials_exception
     
     # Decode token
     try:
-        logger.info(f"Attempting to decode token...")
-        
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
-        logger.info(f"✅ Token decoded successfully")
-        
+        payload = verified_token_cache.decode(token, settings.jwt_secret, algorithms=["HS256"])
         # Get user_id from payload - handle both string and int
         user_id_raw = payload.get("sub") or payload.get("id")
         
         if user_id_raw is None:
-            logger.error(f"❌ No user_id in payload. Payload keys: {payload.keys()}")
+            logger.warning("Token has no user id claim")
             raise credentials_exception
         
         # Convert to int (in case it's a string from JWT)
         try:
             user_id = int(user_id_raw)
         except (ValueError, TypeError):
-            logger.error(f"❌ Invalid user_id format: {user_id_raw}")
+            logger.warning("Invalid user id claim %r", user_id_raw)
             raise credentials_exception
         
-        logger.info(f"✅ User ID from token: {user_id}")
+        # Revoked on logout (in-memory check, no query)
+        jti = payload.get("jti")
+        if jti and revocation_list.is_revoked(jti):
+            logger.warning("Revoked token used", extra={"user_id": user_id})
+            raise credentials_exception
             
+    except HTTPException:
+        raise
     except JWTError as e:
-        logger.error(f"❌ JWT decode error: {type(e).__name__}: {str(e)}")
+        logger.info("JWT rejected: %s: %s", type(e).__name__, e)
         raise credentials_exception
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {type(e).__name__}: {str(e)}")
+        logger.error("Unexpected token error: %s: %s", type(e).__name__, e)
         raise credentials_exception
     
-    # Get user from database
+    # Get user from the user cache, the token claims (opt-in) or the database
     try:
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        user = user_cache.get(user_id)
+        
+        # Claims of a token issued before a write to the user (role change,
+        # deactivation) are stale: read the database instead
+        if (
+            user is None
+            and settings.AUTH_TRUST_TOKEN_CLAIMS
+            and not user_cache.written_since(user_id, payload.get("iat"))
+        ):
+            user = _user_from_claims(user_id, payload)
+        
+        if user is None:
+            user = await user_cache.load(db, user_id)
         
         if user is None:
-            logger.error(f"❌ User not found in DB: {user_id}")
+            logger.warning("Token user not found", extra={"user_id": user_id})
             raise credentials_exception
         
-        logger.info(f"✅ User authenticated: {user.username} (ID: {user.id})")
+        logger.debug("User authenticated", extra={"user_id": user.id})
         return user
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"❌ Database error: {str(e)}")
+        logger.error("Database error during authentication: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error during authentication"
@@ -1,4 +1,11 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
+from fastapi import HTTPException, status
+
+from app.database.config import settings
 
 
 def hash_password(password: str) -> str:
@@ -45,4 +52,98 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
         return bcrypt.checkpw(password_bytes, hashed_bytes)
     except Exception:
-        return False
\ No newline at end of file
+        return False
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop in a bounded thread pool
+
+    bcrypt releases the GIL while hashing, so a few threads let logins run in
+    parallel without blocking other requests on the worker. `max_workers`
+    caps the CPU spent on hashing; calls beyond that wait in the executor
+    queue, and once `max_queue` calls are waiting new ones are rejected
+    with 503 instead of piling up.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 50):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._in_flight = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a free worker thread"""
+        return max(0, self._in_flight - self.max_workers)
+
+    @staticmethod
+    def _timed(func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        return started, time.perf_counter() - started, result
+
+    async def _run(self, func, *args):
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again",
+                headers={"Retry-After": "1"}
+            )
+
+        submitted = time.perf_counter()
+        self._in_flight += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        try:
+            loop = asyncio.get_running_loop()
+            started, run_seconds, result = await loop.run_in_executor(
+                self._executor, self._timed, func, *args
+            )
+        finally:
+            self._in_flight -= 1
+
+        wait = started - submitted
+        self.completed += 1
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.total_run_seconds += run_seconds
+        return result
+
+    async def hash(self, password: str) -> str:
+        """hash_password() in the worker pool"""
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """verify_password() in the worker pool"""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """Pool size, queue depth and timing counters"""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Process-wide bcrypt pool
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE
+)
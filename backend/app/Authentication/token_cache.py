@@ -0,0 +1,71 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from jose import jwt
+
+from app.database.config import settings
+
+
+class VerifiedTokenCache:
+    """
+    LRU of decoded JWT claims, keyed by a digest of the token
+
+    A page load sends the same token with dozens of requests; after the first
+    full jwt.decode (signature, base64, JSON, claim checks) the claims are
+    served from here until the token's exp. The digest is keyed with the
+    signing secret, so rotating JWT_SECRET makes every cached entry
+    unreachable. Revocation is still checked by the caller on every request.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict]]" = OrderedDict()
+        self._secret = None
+        self._digest_key = b""
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, token: str, secret: str) -> bytes:
+        if secret != self._secret:
+            # blake2b keys are limited to 64 bytes, so key with a hash of the secret
+            self._digest_key = hashlib.sha256(secret.encode("utf-8")).digest()
+            self._secret = secret
+            self._entries.clear()
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=20, key=self._digest_key).digest()
+
+    def decode(self, token: str, secret: str, algorithms=("HS256",)) -> Dict:
+        """
+        jwt.decode with caching (same exceptions on invalid tokens)
+
+        The returned dict is shared between requests; don't modify it.
+        """
+        if self.max_entries <= 0:
+            return jwt.decode(token, secret, algorithms=list(algorithms))
+
+        key = self._key(token, secret)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]  # Expired: let jwt.decode raise ExpiredSignatureError
+
+        self.misses += 1
+        payload = jwt.decode(token, secret, algorithms=list(algorithms))
+
+        exp = payload.get("exp")
+        if exp is not None:
+            self._entries[key] = (float(exp), payload)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide cache used by get_current_user
+verified_token_cache = VerifiedTokenCache(max_entries=settings.JWT_CACHE_MAX_ENTRIES)
@@ -1,17 +1,23 @@
 from pydantic_settings import BaseSettings
-from pydantic import field_validator, Field
+from pydantic import field_validator, model_validator, Field
 
 from pathlib import Path
+from typing import Optional
 import urllib.parse
 
 
 # ================= Configuration =================
 class Settings(BaseSettings):
-    DATABASE_SERVER: str
-    DATABASE_NAME: str
-    DATABASE_USER: str
-    DATABASE_PASSWORD: str
+    # SQL Server connection (required unless DATABASE_URL is set)
+    DATABASE_SERVER: str = ""
+    DATABASE_NAME: str = ""
+    DATABASE_USER: str = ""
+    DATABASE_PASSWORD: str = ""
     DATABASE_DRIVER: str = "ODBC Driver 17 for SQL Server"
+    # Full SQLAlchemy URL overriding the SQL Server settings, e.g. local mode
+    # for benchmarks / load tests: sqlite+aiosqlite:///./local.db or
+    # sqlite+aiosqlite:///:memory:
+    DATABASE_URL: Optional[str] = None
     PDF_UPLOAD_PATH: Path  # Use Path type instead of str
     PDF_SOURCE_PATH: Path  # Use Path type instead of str
     MODE: str
@@ -19,6 +25,99 @@ class Settings(BaseSettings):
     node_env: str = Field("development", env="NODE_ENV")  # Ensure development mode
     NODE_ENV: str = "development"  # add default
 
+    # Change feed: only hand out ChangeLog rows older than this, so rows from
+    # transactions that are still committing can't be skipped by a client token
+    CHANGE_FEED_SETTLE_SECONDS: float = 2.0
+
+    # Server-Sent Events (/api/media/events)
+    SSE_HEARTBEAT_SECONDS: float = 15.0
+    SSE_HISTORY_SIZE: int = 1000
+
+    # Conditional GET (ETag / 304) on listing endpoints
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = 30
+
+    # In-process category cache: writes in this process invalidate it at once,
+    # writes from other workers become visible after at most this long
+    CATEGORY_CACHE_TTL_SECONDS: float = 60.0
+
+    # Authenticated user cache (get_current_user). 0 disables it.
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    # Opt-in: build the current user from the signed JWT claims on a cache miss
+    # instead of querying Users. Tokens issued before a user write in this
+    # process are read from the database; changes made by other workers only
+    # apply once the token is refreshed (/refresh re-reads the user) or expires.
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+
+    # bcrypt worker threads (each hash / verify is ~250 ms of CPU) and how many
+    # calls may wait for one before new ones get 503
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 50
+
+    # Login throttling (token buckets per client IP and per username)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 20
+    LOGIN_RATE_LIMIT_USER_BURST: int = 5
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE: float = 2
+    # Optional: share buckets across workers (needs the `redis` package)
+    LOGIN_RATE_LIMIT_REDIS_URL: Optional[str] = None
+
+    # Connection pool: size + overflow caps concurrent connections, requests
+    # wait up to POOL_TIMEOUT seconds for one; connections are recycled after
+    # POOL_RECYCLE seconds and pinged before use when POOL_PRE_PING is on
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 2
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Read replica (readable secondary) for read-only GET routes. Unset =
+    # everything uses the primary. DATABASE_READ_URL takes a full SQLAlchemy
+    # URL instead (e.g. a stand-in database for tests). Reads go to the
+    # primary for READ_YOUR_WRITES_SECONDS after a client's own write, and
+    # for READ_REPLICA_RETRY_SECONDS after the replica failed to connect.
+    DATABASE_READ_SERVER: Optional[str] = None
+    DATABASE_READ_URL: Optional[str] = None
+    READ_YOUR_WRITES_SECONDS: int = 10
+    READ_REPLICA_RETRY_SECONDS: float = 30.0
+
+    # Per-request SQL instrumentation: statement count / DB time in a
+    # Server-Timing header, a warning when a route runs more statements than
+    # its budget (SQL_QUERY_BUDGETS overrides: "GET /api/home=1,..."), and
+    # lazy relationship loads on Media / Category / User flagged as
+    # "off", "warn" or "raise"
+    SQL_INSTRUMENTATION: bool = True
+    SQL_QUERY_BUDGET: int = 10
+    SQL_QUERY_BUDGETS: str = ""
+    SQL_LAZY_LOAD_GUARD: str = "warn"
+
+    # Slow-query log (/api/admin/slow-queries): statements slower than
+    # SLOW_QUERY_MS, aggregated by normalized SQL; percentiles come from the
+    # last SLOW_QUERY_SAMPLES timings per statement shape. Needs SQL_INSTRUMENTATION.
+    SLOW_QUERY_MS: float = 100.0
+    SLOW_QUERY_MAX_FINGERPRINTS: int = 500
+    SLOW_QUERY_SAMPLES: int = 200
+
+    # Write-behind buffer for low-value row updates (Users.last_login, counters)
+    WRITE_BEHIND_FLUSH_SECONDS: float = 5.0
+    WRITE_BEHIND_MAX_PENDING: int = 10000
+
+    # Token revocation (logout): in-memory list size hint and how often
+    # revocations made by other workers are picked up
+    TOKEN_REVOCATION_CAPACITY: int = 100000
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 30.0
+
+    # Decoded-JWT cache (skips signature checks for repeat tokens). 0 disables it.
+    JWT_CACHE_MAX_ENTRIES: int = 4096
+
+    # Logging: root level, per-module overrides ("module=LEVEL,..."), "text" or
+    # "json" lines, and 1-in-N sampling of DEBUG records
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: str = "app.Authentication.auth=WARNING"
+    LOG_FORMAT: str = "text"
+    LOG_DEBUG_SAMPLE_EVERY: int = 100
+
  
 
     class Config:
@@ -36,20 +135,45 @@ class Settings(BaseSettings):
             raise ValueError(f"Path {value} is not a directory")
         return value.resolve()  # Resolve to absolute path
 
-    @property
-    def sqlalchemy_database_url(self) -> str:
+    @model_validator(mode="after")
+    def validate_database(self) -> "Settings":
+        if not self.DATABASE_URL:
+            missing = [
+                name for name in ("DATABASE_SERVER", "DATABASE_NAME", "DATABASE_USER", "DATABASE_PASSWORD")
+                if not getattr(self, name)
+            ]
+            if missing:
+                raise ValueError(f"Set DATABASE_URL or {', '.join(missing)}")
+        return self
+
+    def _odbc_url(self, server: str, extra: str = "") -> str:
         params = urllib.parse.quote_plus(
             f"DRIVER={self.DATABASE_DRIVER};"
-            f"SERVER={self.DATABASE_SERVER};"
+            f"SERVER={server};"
             f"DATABASE={self.DATABASE_NAME};"
             f"UID={self.DATABASE_USER};"
             f"PWD={self.DATABASE_PASSWORD};"
             f"TrustServerCertificate=yes;"
             f"MARS_Connection=Yes;"
             f"CHARSET=UTF8;"
+            f"{extra}"
         )
         return f"mssql+aioodbc:///?odbc_connect={params}"
 
+    @property
+    def sqlalchemy_database_url(self) -> str:
+        return self.DATABASE_URL or self._odbc_url(self.DATABASE_SERVER)
+
+    @property
+    def sqlalchemy_read_database_url(self) -> Optional[str]:
+        """Replica URL, or None when no replica is configured"""
+        if self.DATABASE_READ_URL:
+            return self.DATABASE_READ_URL
+        if self.DATABASE_READ_SERVER:
+            # ReadOnly intent lets an availability group listener route to a secondary
+            return self._odbc_url(self.DATABASE_READ_SERVER, "ApplicationIntent=ReadOnly;")
+        return None
+
 
 # Instantiate settings
 settings = Settings()
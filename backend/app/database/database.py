@@ -1,18 +1,75 @@
+import asyncio
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.database.config import settings
+from app.database.pool_metrics import TimedQueuePool, current_route, instrument_pool
+from app.database.query_metrics import instrument_queries
+from app.database.replica import ReplicaHealth, has_recent_write
 from typing import AsyncGenerator
 
 
-# Create async engine for SQL Server using aioodbc
-engine = create_async_engine(
-    settings.sqlalchemy_database_url,  # must be mssql+aioodbc://
-    echo=False,
-    future=True,
-    pool_size=5,
-    max_overflow=2,
-    pool_timeout=30
-)
+def _create_engine(url: str):
+    if make_url(url).get_backend_name() == "sqlite":
+        return _create_sqlite_engine(url)
+
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
+
+
+def _create_sqlite_engine(url: str):
+    """
+    Local mode (DATABASE_URL=sqlite+aiosqlite:///...) for benchmarks and load tests
+
+    An in-memory database lives in a single connection, so it keeps the
+    dialect's StaticPool; file databases get the normal timed pool.
+    Foreign keys are enforced (ON DELETE CASCADE) and files use WAL so
+    readers don't block on the writer.
+    """
+    database = make_url(url).database
+    in_memory = database in (None, "", ":memory:")
+
+    options = {"echo": False, "future": True}
+    if not in_memory:
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT
+        )
+    sqlite_engine = create_async_engine(url, **options)
+
+    @event.listens_for(sqlite_engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+    return sqlite_engine
+
+
+# Async engine: SQL Server via aioodbc, or DATABASE_URL (e.g. local SQLite)
+engine = _create_engine(settings.sqlalchemy_database_url)
+
+# Checkout waits, overflow use and per-route hold times (/api/admin/db-pool)
+pool_metrics = instrument_pool(engine, "primary")
+if settings.SQL_INSTRUMENTATION:
+    instrument_queries(engine)
 
 # Async sessionmaker
 AsyncSessionLocal = sessionmaker(
@@ -23,10 +80,70 @@ AsyncSessionLocal = sessionmaker(
     autocommit=False,
 )
 
+# Optional read replica (readable secondary) for get_async_read_db
+read_engine = None
+read_pool_metrics = None
+ReadSessionLocal = None
+replica_health = ReplicaHealth(retry_seconds=settings.READ_REPLICA_RETRY_SECONDS)
+
+if settings.sqlalchemy_read_database_url:
+    read_engine = _create_engine(settings.sqlalchemy_read_database_url)
+    read_pool_metrics = instrument_pool(read_engine, "replica")
+    if settings.SQL_INSTRUMENTATION:
+        instrument_queries(read_engine)
+    ReadSessionLocal = sessionmaker(
+        bind=read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
 # Base class for ORM models
 Base = declarative_base()
 
+
+def _tag_route(request: Request) -> None:
+    """Label connections checked out by this request with its route template"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or request.url.path
+    current_route.set(f"{request.method} {path}")
+
+
 #see docs
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    _tag_route(request)
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def _replica_connected(session: AsyncSession) -> bool:
+    try:
+        await session.connection()
+        return True
+    except (DBAPIError, PoolTimeoutError, OSError, asyncio.TimeoutError) as e:
+        replica_health.mark_down(e)
+        return False
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only routes: the replica when configured, else the primary
+
+    Falls back to the primary when no replica is configured, when the
+    replica failed recently, or for a client that wrote within the last
+    READ_YOUR_WRITES_SECONDS (read-your-writes cookie). Only use it for
+    routes that never write; replica data may lag the primary slightly.
+    """
+    _tag_route(request)
+
+    if ReadSessionLocal is not None and replica_health.available and not has_recent_write(request):
+        async with ReadSessionLocal() as session:
+            if await _replica_connected(session):
+                replica_health.replica_reads += 1
+                yield session
+                return
+
+    replica_health.primary_reads += 1
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
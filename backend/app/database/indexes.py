@@ -0,0 +1,72 @@
+from typing import Dict, List
+import logging
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+# Indexes the query layer relies on (declared in the models, and created on
+# existing SQL Server databases by the scripts in migrations/)
+EXPECTED_INDEXES: Dict[str, List[str]] = {
+    "Media": [
+        "IX_Media_active_created_at",
+        "IX_Media_active_category_created_at",
+        "IX_Media_active_type_created_at",
+    ],
+    "MediaPaths": [
+        "IX_MediaPaths_media_primary_sort",
+    ],
+    "ChangeLog": [
+        "IX_ChangeLog_entity",
+    ],
+    "Users": [
+        "UX_Users_username_key",
+    ],
+    "RevokedTokens": [
+        "IX_RevokedTokens_expires_at",
+    ],
+}
+
+
+async def check_expected_indexes(engine: AsyncEngine) -> Dict[str, List[str]]:
+    """
+    Report which expected indexes are missing from the connected database
+    
+    Args:
+        engine: Async engine to inspect
+        
+    Returns:
+        Dictionary of table name -> list of missing index names
+        (empty dictionary when everything is in place)
+    """
+    def _missing(sync_conn) -> Dict[str, List[str]]:
+        inspector = inspect(sync_conn)
+        missing = {}
+        
+        for table_name, index_names in EXPECTED_INDEXES.items():
+            if not inspector.has_table(table_name):
+                missing[table_name] = list(index_names)
+                continue
+            
+            existing = {ix["name"] for ix in inspector.get_indexes(table_name)}
+            absent = [name for name in index_names if name not in existing]
+            if absent:
+                missing[table_name] = absent
+        
+        return missing
+    
+    async with engine.connect() as conn:
+        missing = await conn.run_sync(_missing)
+    
+    if missing:
+        for table_name, index_names in missing.items():
+            logger.warning(
+                "Missing indexes on %s: %s (run the scripts in migrations/)",
+                table_name, ", ".join(index_names)
+            )
+    else:
+        logger.info("All expected indexes are present")
+    
+    return missing
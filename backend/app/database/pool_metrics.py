@@ -0,0 +1,164 @@
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Route template ("GET /api/media/{media_id}") of the request using the
+# database, set by get_async_db; None for background tasks
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+# Upper bounds (ms) of the checkout wait histogram buckets; the last one is open
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 30000)
+
+
+class PoolMetrics:
+    """
+    Counters for one connection pool
+
+    Wait times (how long a checkout blocked for a free connection, including
+    opening a new one) come from TimedQueuePool; the rest from pool events.
+    Checkout duration is how long a request held its connection, per route.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        # route -> [checkouts, total seconds, max seconds]
+        self.routes: Dict[str, list] = {}
+
+    def record_wait(self, seconds: float) -> None:
+        milliseconds = seconds * 1000
+        bucket = next(
+            (i for i, bound in enumerate(WAIT_BUCKETS_MS) if milliseconds <= bound),
+            len(WAIT_BUCKETS_MS)
+        )
+        self.wait_buckets[bucket] += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def record_checkout(self, pool) -> None:
+        self.checkouts += 1
+        if isinstance(pool, QueuePool):
+            self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+            self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def record_checkin(self, route: str, seconds: float) -> None:
+        entry = self.routes.get(route)
+        if entry is None:
+            entry = self.routes[route] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+    def stats(self, pool) -> dict:
+        """Current pool state plus counters since start (or the last reset)"""
+        waits = sum(self.wait_buckets)
+        labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+        # Sizing only applies to queue pools (not the single-connection
+        # StaticPool used for in-memory SQLite)
+        queue = isinstance(pool, QueuePool)
+        return {
+            "name": self.name,
+            "pool_class": type(pool).__name__,
+            "pool_size": pool.size() if queue else None,
+            "max_overflow": pool._max_overflow if queue else None,
+            "timeout_seconds": pool.timeout() if queue else None,
+            "checked_out": pool.checkedout() if queue else None,
+            "checked_in": pool.checkedin() if queue else None,
+            "overflow": max(0, pool.overflow()) if queue else None,
+            "peak_checked_out": self.peak_checked_out,
+            "peak_overflow": max(0, self.peak_overflow),
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait": {
+                "count": waits,
+                "avg_ms": round(self.total_wait_seconds / waits * 1000, 2) if waits else 0.0,
+                "max_ms": round(self.max_wait_seconds * 1000, 2),
+                "histogram": dict(zip(labels, self.wait_buckets))
+            },
+            "routes": {
+                route: {
+                    "checkouts": count,
+                    "avg_ms": round(total / count * 1000, 2),
+                    "max_ms": round(longest * 1000, 2)
+                }
+                for route, (count, total, longest) in sorted(
+                    self.routes.items(), key=lambda item: item[1][1], reverse=True
+                )
+            }
+        }
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times how long each checkout waits"""
+
+    # Log under sqlalchemy.pool like the stock pool (quiet unless enabled)
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.TimedQueuePool"
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.timeouts += 1
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_pool(engine, name: str) -> PoolMetrics:
+    """
+    Attach PoolMetrics to an async engine's pool
+
+    Args:
+        engine: AsyncEngine created with poolclass=TimedQueuePool
+        name: Label shown in the metrics ("primary", ...)
+
+    Returns:
+        The metrics object (also reachable as engine.pool.metrics)
+    """
+    sync_engine = engine.sync_engine
+    metrics = PoolMetrics(name)
+    sync_engine.pool.metrics = metrics
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        connection_record.info["route"] = current_route.get() or "background"
+        metrics.record_checkout(sync_engine.pool)
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        route = connection_record.info.pop("route", "background")
+        if checked_out_at is not None:
+            metrics.record_checkin(route, time.perf_counter() - checked_out_at)
+
+    return metrics
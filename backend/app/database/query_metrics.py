@@ -0,0 +1,184 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+
+from app.database.pool_metrics import current_route
+from app.database.slow_query_log import slow_query_log
+
+logger = logging.getLogger(__name__)
+
+
+class RequestSqlStats:
+    """Statements run while handling one request"""
+
+    __slots__ = ("count", "total_seconds", "slowest_seconds", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        """Server-Timing value (shown per request in the browser's network tab)"""
+        return (
+            f'db;dur={self.total_seconds * 1000:.2f};desc="{self.count} queries", '
+            f'db-slowest;dur={self.slowest_seconds * 1000:.2f}'
+        )
+
+
+# Stats of the request being handled, set by SqlTimingMiddleware; None
+# outside requests (startup, background flushes)
+request_sql: ContextVar[Optional[RequestSqlStats]] = ContextVar("request_sql", default=None)
+
+
+def instrument_queries(engine) -> None:
+    """
+    Time every statement run through an async engine
+
+    Statements run inside a request are added to that request's
+    RequestSqlStats (one count per round trip; executemany counts once);
+    every statement is offered to the slow-query log.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._sql_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_sql_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+
+        stats = request_sql.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        slow_query_log.record(statement, elapsed, current_route.get())
+
+
+def parse_budgets(spec: str) -> Dict[str, int]:
+    """
+    Parse "METHOD /route/template=N,..." (e.g. "GET /api/home=1,GET /api/media/{media_id}=3")
+
+    Entries without a valid integer are ignored.
+    """
+    budgets = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        route, _, budget = item.rpartition("=")
+        if route.strip() and budget.strip().isdigit():
+            budgets[" ".join(route.split())] = int(budget)
+    return budgets
+
+
+def _route_key(scope) -> str:
+    route = scope.get("route")
+    return f"{scope['method']} {getattr(route, 'path', None) or scope['path']}"
+
+
+class SqlTimingMiddleware:
+    """
+    Per-request SQL count and time, as a Server-Timing header
+
+    Also warns when a route runs more statements than its budget
+    (SQL_QUERY_BUDGET, or its own entry in SQL_QUERY_BUDGETS), which is
+    how extra round trips (N+1 loads, refresh loops) show up in the logs.
+    Statements run after the response headers are sent (streamed bodies)
+    are counted in the budget check but not in the header.
+    """
+
+    def __init__(self, app, budget: int = 10, budgets: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.budget = budget
+        self.budgets = budgets or {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSqlStats()
+        token = request_sql.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_sql.reset(token)
+            self._check_budget(scope, stats)
+
+    def _check_budget(self, scope, stats: RequestSqlStats) -> None:
+        route = _route_key(scope)
+        budget = self.budgets.get(route, self.budget)
+        if stats.count > budget:
+            logger.warning(
+                "Query budget exceeded",
+                extra={
+                    "route": route,
+                    "queries": stats.count,
+                    "budget": budget,
+                    "db_ms": round(stats.total_seconds * 1000, 2),
+                    "slowest_ms": round(stats.slowest_seconds * 1000, 2),
+                    "slowest_sql": (stats.slowest_statement or "")[:200]
+                }
+            )
+
+
+def install_lazy_load_guard(mode: str, models) -> None:
+    """
+    Flag lazy relationship loads on the given models
+
+    Lazy loads are the silent N+1: one extra SELECT per row, and under
+    asyncio they fail with an unhelpful MissingGreenlet. Code should use
+    selectinload / joinedload instead. "warn" logs the relationship and
+    route, "raise" fails the load with a clear error, "off" does nothing.
+
+    Args:
+        mode: "off", "warn" or "raise"
+        models: Mapped classes whose relationships are guarded
+    """
+    mode = mode.lower()
+    if mode not in ("warn", "raise"):
+        return
+
+    guarded = tuple(models)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _guard_lazy_load(orm_execute_state):
+        if not orm_execute_state.is_relationship_load:
+            return
+        state = orm_execute_state.lazy_loaded_from
+        if state is None or not issubclass(state.class_, guarded):
+            return
+
+        path = orm_execute_state.loader_strategy_path
+        relationship = f"{state.class_.__name__}.{getattr(path[-1], 'key', '?')}" if path else state.class_.__name__
+
+        if mode == "raise":
+            raise InvalidRequestError(
+                f"Lazy load of {relationship} (route {current_route.get() or 'background'}); "
+                f"load it with selectinload() / joinedload()"
+            )
+        logger.warning(
+            "Lazy relationship load",
+            extra={"relationship": relationship, "route": current_route.get() or "background"}
+        )
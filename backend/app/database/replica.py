@@ -0,0 +1,89 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+# Cookie holding the epoch second until which this client reads from the primary
+RECENT_WRITE_COOKIE = "recent_write"
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReplicaHealth:
+    """
+    Tracks whether the read replica is usable
+
+    After a failed connect the replica is skipped for `retry_seconds`, so a
+    down secondary costs one failed attempt per interval instead of one per
+    request.
+    """
+
+    def __init__(self, retry_seconds: float = 30.0):
+        self.retry_seconds = retry_seconds
+        self._down_until = 0.0
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.failures = 0
+        self.last_error = None
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def mark_down(self, error: Exception) -> None:
+        self.failures += 1
+        self.last_error = str(error)
+        self._down_until = time.monotonic() + self.retry_seconds
+        logger.warning("Read replica unavailable, using primary for %.0fs: %s", self.retry_seconds, error)
+
+    def stats(self) -> dict:
+        return {
+            "available": self.available,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "failures": self.failures,
+            "last_error": self.last_error
+        }
+
+
+def has_recent_write(request: Request) -> bool:
+    """True while the client's read-your-writes cookie is current"""
+    value = request.cookies.get(RECENT_WRITE_COOKIE)
+    try:
+        return value is not None and int(value) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    Marks clients that just wrote so their reads skip the replica
+
+    Every successful non-GET request (upload, edit, delete, ...) gets a
+    short-lived cookie; get_async_read_db sends that client's reads to the
+    primary until it expires, so nobody sees their own change missing
+    because of replica lag.
+    """
+
+    def __init__(self, app, seconds: int = 10):
+        self.app = app
+        self.seconds = seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS or self.seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = int(time.time()) + self.seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{RECENT_WRITE_COOKIE}={until}; Max-Age={self.seconds}; Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
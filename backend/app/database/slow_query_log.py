@@ -0,0 +1,212 @@
+import csv
+import hashlib
+import io
+import os
+import re
+import sys
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import greenlet
+
+from app.database.config import settings
+
+# Source root of the app package; call sites are the first frame under it
+# outside app/database (the engine / instrumentation layer itself)
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+_SKIP_DIR = os.path.join(_APP_DIR, "database") + os.sep
+
+# Distinct call sites / routes kept per fingerprint; the rest count as "other"
+_MAX_SITES = 10
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"N?'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b0x[0-9a-fA-F]+\b|(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|@P\d+|\?")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_ROWS = re.compile(r"(\(\?(?:, \?)*(?:, \.\.\.)?\))(?:\s*,\s*\(\?(?:, \?)*(?:, \.\.\.)?\))+")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """
+    Normalized statement shape: literals and bind placeholders become ?,
+    IN lists and multi-row VALUES collapse, whitespace is squeezed
+
+    "SELECT ... WHERE id IN (?, ?, ?) AND name = 'x'" and the same query with
+    other values / list lengths give the same fingerprint.
+    """
+    sql = _COMMENT.sub(" ", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _SPACE.sub(" ", sql).strip()
+    sql = _LIST.sub("(?, ...)", sql)
+    sql = _ROWS.sub(r"\1, ...", sql)
+    return sql
+
+
+def _call_site() -> str:
+    """
+    First app frame (file:line in function) that led to the statement
+
+    Under asyncio the statement runs in SQLAlchemy's greenlet; the awaiting
+    coroutines (service, route) are on the parent greenlet's frame chain.
+    """
+    current = greenlet.getcurrent()
+    frames = [sys._getframe(2)]
+    if current.parent is not None and current.parent.gr_frame is not None:
+        frames.insert(0, current.parent.gr_frame)
+
+    for frame in frames:
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(_APP_DIR) and not filename.startswith(_SKIP_DIR):
+                relative = os.path.relpath(filename, os.path.dirname(_APP_DIR.rstrip(os.sep)))
+                return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+            frame = frame.f_back
+    return "unknown"
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _bump(counts: Dict[str, int], key: str) -> None:
+    if key not in counts and len(counts) >= _MAX_SITES:
+        key = "other"
+    counts[key] = counts.get(key, 0) + 1
+
+
+class _Entry:
+    __slots__ = ("sql", "count", "total_seconds", "max_seconds", "samples",
+                 "call_sites", "routes", "first_seen", "last_seen")
+
+    def __init__(self, sql: str, samples: int):
+        self.sql = sql
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.samples = deque(maxlen=samples)
+        self.call_sites: Dict[str, int] = {}
+        self.routes: Dict[str, int] = {}
+        self.first_seen = datetime.utcnow()
+        self.last_seen = self.first_seen
+
+
+class SlowQueryLog:
+    """
+    In-memory aggregate of slow statements by fingerprint
+
+    Fed by the after_cursor_execute hook (query_metrics.instrument_queries).
+    Statements under `threshold_ms` cost one comparison; slower ones are
+    normalized (cached per statement text) and added to their fingerprint's
+    count / total / max, a window of recent timings for p50 / p95, and
+    counters of call sites and routes. Bind values are never stored.
+    """
+
+    def __init__(self, threshold_ms: float = 100.0, max_fingerprints: int = 500, samples: int = 200):
+        self.threshold_seconds = threshold_ms / 1000
+        self.max_fingerprints = max_fingerprints
+        self.samples = samples
+        self.reset()
+
+    def reset(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+        self.captured = 0
+        self.dropped = 0
+        self.since = datetime.utcnow()
+
+    def record(self, statement: str, seconds: float, route: Optional[str] = None) -> None:
+        if seconds < self.threshold_seconds:
+            return
+
+        sql = fingerprint(statement)
+        entry = self._entries.get(sql)
+        if entry is None:
+            if len(self._entries) >= self.max_fingerprints:
+                self.dropped += 1
+                return
+            entry = self._entries[sql] = _Entry(sql, self.samples)
+
+        self.captured += 1
+        entry.count += 1
+        entry.total_seconds += seconds
+        entry.max_seconds = max(entry.max_seconds, seconds)
+        entry.samples.append(seconds)
+        entry.last_seen = datetime.utcnow()
+        _bump(entry.call_sites, _call_site())
+        _bump(entry.routes, route or "background")
+
+    @staticmethod
+    def _summary(entry: _Entry) -> dict:
+        ordered = sorted(entry.samples)
+        return {
+            "id": hashlib.blake2b(entry.sql.encode("utf-8"), digest_size=6).hexdigest(),
+            "count": entry.count,
+            "total_ms": round(entry.total_seconds * 1000, 2),
+            "avg_ms": round(entry.total_seconds / entry.count * 1000, 2),
+            "p50_ms": round(_percentile(ordered, 0.50) * 1000, 2),
+            "p95_ms": round(_percentile(ordered, 0.95) * 1000, 2),
+            "max_ms": round(entry.max_seconds * 1000, 2),
+            "call_sites": dict(sorted(entry.call_sites.items(), key=lambda item: -item[1])),
+            "routes": dict(sorted(entry.routes.items(), key=lambda item: -item[1])),
+            "first_seen": entry.first_seen.isoformat(),
+            "last_seen": entry.last_seen.isoformat(),
+            "sql": entry.sql
+        }
+
+    def report(self, limit: Optional[int] = 20, sort: str = "total_ms") -> dict:
+        """
+        Top fingerprints by `sort` (total_ms, count, avg_ms, p95_ms or max_ms)
+
+        Args:
+            limit: Number of fingerprints to return (None = all)
+            sort: Summary field to order by, descending
+
+        Returns:
+            Dictionary with the threshold, counters and the "queries" list
+        """
+        summaries = sorted(
+            (self._summary(entry) for entry in self._entries.values()),
+            key=lambda item: item[sort],
+            reverse=True
+        )
+        return {
+            "threshold_ms": round(self.threshold_seconds * 1000, 2),
+            "since": self.since.isoformat(),
+            "captured": self.captured,
+            "fingerprints": len(self._entries),
+            "dropped": self.dropped,
+            "queries": summaries if limit is None else summaries[:limit]
+        }
+
+    def to_csv(self, sort: str = "total_ms") -> str:
+        """All fingerprints as CSV (top call site / route per row)"""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow([
+            "id", "count", "total_ms", "avg_ms", "p50_ms", "p95_ms", "max_ms",
+            "top_call_site", "top_route", "sql"
+        ])
+        for item in self.report(limit=None, sort=sort)["queries"]:
+            writer.writerow([
+                item["id"], item["count"], item["total_ms"], item["avg_ms"],
+                item["p50_ms"], item["p95_ms"], item["max_ms"],
+                next(iter(item["call_sites"]), ""), next(iter(item["routes"]), ""),
+                item["sql"]
+            ])
+        return output.getvalue()
+
+
+# Process-wide slow-query log (/api/admin/slow-queries)
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_MS,
+    max_fingerprints=settings.SLOW_QUERY_MAX_FINGERPRINTS,
+    samples=settings.SLOW_QUERY_SAMPLES
+)
@@ -0,0 +1,41 @@
+from sqlalchemy import BigInteger, DateTime, Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# BIGINT primary key that still autoincrements on SQLite (only an INTEGER
+# PRIMARY KEY column is an alias for the rowid there)
+BigIntegerPK = BigInteger().with_variant(Integer(), "sqlite")
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC timestamp, rendered per dialect
+
+    Use instead of func.getutcdate() for column defaults / onupdate and for
+    "touch updated_at" assignments, so the models work on SQL Server and on
+    the local SQLite mode.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "mssql")
+def _utcnow_mssql(element, compiler, **kw):
+    return "GETUTCDATE()"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "(now() AT TIME ZONE 'utc')"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is UTC on SQLite; keep sub-second precision like GETUTCDATE()
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
@@ -8,22 +8,35 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 #  SQLAlchemy engine and base (used to create tables)
-from app.database.database import engine, Base
+from app.database.database import engine, read_engine, Base, AsyncSessionLocal
+from app.database.replica import ReadYourWritesMiddleware
+from app.database.query_metrics import SqlTimingMiddleware, install_lazy_load_guard, parse_budgets
+from app.database.indexes import check_expected_indexes
 
 #  Custom app settings from .env or config file
 from app.database.config import settings
 
 from app.routes import auth, users
 
-from app.routes import auth, users, media_upload,categories,media
+from app.routes import auth, users, media_upload,categories,media,home,changes,admin
 
-import logging
+from app.services.search_service import media_search_index
+from app.services.suggest_service import title_suggest_index
+from app.services.event_broadcaster import media_events
+from app.services.category_cache import category_cache
+from app.Authentication.password import password_hasher
+from app.services.write_behind import write_behind
+from app.services.token_revocation import revocation_list
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.models import Category, Media, User
+from app.logging_config import setup_logging
+
+# Configure logging (levels / format from Settings, queue-backed output,
+# drained at interpreter exit)
+setup_logging(settings)
+
+# Flag accidental lazy loads (N+1) on the main models
+install_lazy_load_guard(settings.SQL_LAZY_LOAD_GUARD, (Media, Category, User))
 
 # Log JWT secret on startup (REMOVE IN PRODUCTION!)
 print("=" * 50)
@@ -55,9 +68,42 @@ async def lifespan(app: FastAPI):
         print("🚀 PRODUCTION Mode: Skipping Table Creation.")
         print(f"{app.title}...")
 
+    # Report (don't fail on) missing query indexes
+    try:
+        missing_indexes = await check_expected_indexes(engine)
+        if missing_indexes:
+            print(f"⚠️ Missing indexes: {missing_indexes}")
+    except Exception as e:
+        print(f"⚠️ Index check skipped: {e}")
+
+    # Build the in-memory media search / typeahead indexes and category cache.
+    # Like the index check, report (don't fail on) errors: each structure
+    # starts empty and is filled by later writes, lazy loads or the periodic sync
+    for name, warm_up in (
+        ("media search index", media_search_index.rebuild),
+        ("title suggest index", title_suggest_index.rebuild),
+        ("category cache", category_cache.load),
+        ("token revocation list", revocation_list.load),
+    ):
+        try:
+            async with AsyncSessionLocal() as db:
+                await warm_up(db)
+        except Exception as e:
+            print(f"⚠️ Startup warm-up of {name} skipped: {e}")
+
+    write_behind.start()
+    revocation_list.start()
+
     yield  #  Allows the application to continue startup
 
+    await write_behind.stop()  # Flush pending last_login / counter updates
+    await revocation_list.stop()
+
+    media_events.close()
+    password_hasher.shutdown()
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
 
 
 def create_app() -> FastAPI:              #create_app() just defines a factory function returning a FastAPI app.
@@ -84,12 +130,27 @@ def create_app() -> FastAPI:              #create_app() just defines a factory f
         expose_headers=["Set-Cookie"],    # ← Expose Set-Cookie header
     )
 
+    # After a write, send that client's reads to the primary (replica lag)
+    if read_engine is not None:
+        app.add_middleware(ReadYourWritesMiddleware, seconds=settings.READ_YOUR_WRITES_SECONDS)
+
+    # Per-request statement count / DB time (Server-Timing) and query budgets
+    if settings.SQL_INSTRUMENTATION:
+        app.add_middleware(
+            SqlTimingMiddleware,
+            budget=settings.SQL_QUERY_BUDGET,
+            budgets=parse_budgets(settings.SQL_QUERY_BUDGETS)
+        )
+
     #  Register routers
     app.include_router(auth.router)
     app.include_router(users.router)
     app.include_router(media_upload.router)
     app.include_router(categories.router)
     app.include_router(media.router)  
+    app.include_router(home.router)
+    app.include_router(changes.router)
+    app.include_router(admin.router)
 
 
 
@@ -2,6 +2,8 @@ from app.models.users import User
 from app.models.categories import Category
 from app.models.media import Media
 from app.models.media_path import MediaPath
+from app.models.change_log import ChangeLog
+from app.models.revoked_token import RevokedToken
 
 # This ensures all models are imported and SQLAlchemy can build relationships
-__all__ = ["User", "Category", "Media", "MediaPath"]
\ No newline at end of file
+__all__ = ["User", "Category", "Media", "MediaPath", "ChangeLog", "RevokedToken"]
\ No newline at end of file
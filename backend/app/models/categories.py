@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 from app.database.database import Base
+from app.database.types import utcnow
 
 
 class Category(Base):
@@ -14,9 +14,9 @@ class Category(Base):
     color_code = Column(String(7), nullable=True)
     sort_order = Column(Integer, nullable=True, default=0)
     is_active = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime, nullable=False, default=func.getutcdate())
+    created_at = Column(DateTime, nullable=False, default=utcnow())
     created_by = Column(Integer, ForeignKey("Users.id"), nullable=False)
-    updated_at = Column(DateTime, nullable=False, default=func.getutcdate(), onupdate=func.getutcdate())
+    updated_at = Column(DateTime, nullable=False, default=utcnow(), onupdate=utcnow())
     
     # Relationships
     creator = relationship(
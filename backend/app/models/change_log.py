@@ -0,0 +1,22 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
+from app.database.database import Base
+from app.database.types import BigIntegerPK, utcnow
+
+
+class ChangeLog(Base):
+    """Append-only log of media / category writes (drives /api/changes)"""
+    
+    __tablename__ = "ChangeLog"
+    
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)  # Monotonic sync token
+    entity_type = Column(String(20), nullable=False)  # 'media' or 'category'
+    entity_id = Column(BigInteger, nullable=False)
+    action = Column(String(20), nullable=False)  # 'create', 'update', 'toggle', 'delete'
+    changed_at = Column(DateTime, nullable=False, server_default=utcnow())
+    
+    __table_args__ = (
+        Index("IX_ChangeLog_entity", entity_type, entity_id),
+    )
+    
+    def __repr__(self):
+        return f"<ChangeLog(id={self.id}, {self.entity_type}:{self.entity_id} {self.action})>"
@@ -1,7 +1,21 @@
-from sqlalchemy import Column, BigInteger, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 from app.database.database import Base
+from app.database.types import BigIntegerPK, utcnow
+
+
+# Non-key columns carried in the covering indexes below. is_active is listed too:
+# SQL Server can only return a filter-predicate column from a filtered index if it
+# is part of the index.
+_COVERED_COLUMNS = [
+    "title", "description", "category_id", "user_id", "media_type",
+    "is_active", "updated_at", "updated_by",
+]
+
+
+def _covered_except(*key_columns: str) -> list:
+    """INCLUDE list minus the index key columns (SQL Server rejects duplicates)"""
+    return [name for name in _COVERED_COLUMNS if name not in key_columns]
 
 
 class Media(Base):
@@ -9,17 +23,50 @@ class Media(Base):
     
     __tablename__ = "Media"
     
-    id = Column(BigInteger, primary_key=True, index=True)
+    id = Column(BigIntegerPK, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
     description = Column(String(1000), nullable=True)
     category_id = Column(Integer, ForeignKey("Categories.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("Users.id"), nullable=False, index=True)
     media_type = Column(String(20), nullable=False, index=True)  # 'image' or 'video'
     is_active = Column(Boolean, nullable=False, default=True, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.getutcdate(), index=True)
-    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.getutcdate(), onupdate=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=utcnow(), index=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=utcnow(), onupdate=utcnow())
     updated_by = Column(Integer, ForeignKey("Users.id"), nullable=True)
     
+    # ========== COVERING INDEXES (current-month queries) ==========
+    # All listing queries filter on is_active = 1 + a created_at range, optionally
+    # narrowed by category_id / media_type, and sort by created_at DESC.
+    # Filtered (is_active = 1) indexes keep them small, and the INCLUDE list covers
+    # every column of Media, so no key lookups are needed. SQLite (local mode)
+    # gets the same filtered indexes without the INCLUDE lists.
+    # Existing databases: see migrations/001_media_covering_indexes.sql
+    __table_args__ = (
+        Index(
+            "IX_Media_active_created_at",
+            created_at.desc(),
+            mssql_where=text("is_active = 1"),
+            sqlite_where=text("is_active = 1"),
+            mssql_include=_COVERED_COLUMNS,
+        ),
+        Index(
+            "IX_Media_active_category_created_at",
+            category_id,
+            created_at.desc(),
+            mssql_where=text("is_active = 1"),
+            sqlite_where=text("is_active = 1"),
+            mssql_include=_covered_except("category_id"),
+        ),
+        Index(
+            "IX_Media_active_type_created_at",
+            media_type,
+            created_at.desc(),
+            mssql_where=text("is_active = 1"),
+            sqlite_where=text("is_active = 1"),
+            mssql_include=_covered_except("media_type"),
+        ),
+    )
+    
     # ========== CORRECTED RELATIONSHIPS ==========
     
     # Relationship: Media belongs to a category
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, BigInteger, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 from app.database.database import Base
+from app.database.types import BigIntegerPK, utcnow
 
 
 class MediaPath(Base):
@@ -9,7 +9,7 @@ class MediaPath(Base):
     
     __tablename__ = "MediaPaths"
     
-    id = Column(BigInteger, primary_key=True, index=True)
+    id = Column(BigIntegerPK, primary_key=True, index=True)
     media_id = Column(BigInteger, ForeignKey("Media.id", ondelete="CASCADE"), nullable=False, index=True)
     file_path = Column(String(None), nullable=False)  # String(None) = String(max) in SQL Server
     file_name = Column(String(255), nullable=False)
@@ -18,9 +18,15 @@ class MediaPath(Base):
     mime_type = Column(String(100), nullable=True)  # 'image/jpeg', 'video/mp4'
     is_primary = Column(Boolean, nullable=False, default=False, index=True)
     sort_order = Column(Integer, nullable=False, default=0)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=utcnow())
     created_by = Column(Integer, ForeignKey("Users.id"), nullable=False)
     
+    # Serves selectinload(Media.paths) and "primary file first" lookups
+    # Existing databases: see migrations/001_media_covering_indexes.sql
+    __table_args__ = (
+        Index("IX_MediaPaths_media_primary_sort", media_id, is_primary, sort_order),
+    )
+    
     # Relationships
     media = relationship(
         "Media", 
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from app.database.database import Base
+from app.database.types import BigIntegerPK, utcnow
+
+
+class RevokedToken(Base):
+    """JWT ids revoked before their expiry (logout); rows can be purged after expires_at"""
+    
+    __tablename__ = "RevokedTokens"
+    
+    id = Column(BigIntegerPK, primary_key=True, autoincrement=True)  # Incremental sync cursor
+    jti = Column(String(64), nullable=False, unique=True)
+    user_id = Column(Integer, nullable=True)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=False, server_default=utcnow())
+    
+    __table_args__ = (
+        Index("IX_RevokedTokens_expires_at", expires_at),
+    )
+    
+    def __repr__(self):
+        return f"<RevokedToken(jti={self.jti}, user_id={self.user_id})>"
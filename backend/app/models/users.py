@@ -1,7 +1,12 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index
+from sqlalchemy.orm import relationship, validates
 from app.database.database import Base
+from app.database.types import utcnow
+
+
+def normalize_username(username: str) -> str:
+    """Lookup key for a username (trimmed, lower-cased; same as the migration backfill)"""
+    return username.strip().lower()
 
 
 class User(Base):
@@ -9,13 +14,26 @@ class User(Base):
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     username = Column(String(50), nullable=False, unique=True, index=True)
+    # Normalized username for equality lookups (an index seek, unlike ILIKE).
+    # Maintained by _sync_username_key; don't assign directly.
+    username_key = Column(String(50), nullable=False)
     password = Column(Text, nullable=False)  # Store hashed password
     permission = Column(String(10), nullable=False, default="user")
     role = Column(String(20), nullable=False, default="viewer")
     is_active = Column(Boolean, nullable=False, default=True)
     last_login = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=func.getutcdate())
-    updated_at = Column(DateTime, nullable=False, default=func.getutcdate(), onupdate=func.getutcdate())
+    created_at = Column(DateTime, nullable=False, default=utcnow())
+    updated_at = Column(DateTime, nullable=False, default=utcnow(), onupdate=utcnow())
+    
+    __table_args__ = (
+        Index("UX_Users_username_key", "username_key", unique=True),
+    )
+    
+    @validates("username")
+    def _sync_username_key(self, key, value):
+        if value is not None:
+            self.username_key = normalize_username(value)
+        return value
     
     # ========== ADD THESE RELATIONSHIPS ==========
     
@@ -0,0 +1,99 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Literal
+from fastapi import APIRouter, Depends, Query, Response
+
+from app.database.database import engine, pool_metrics, read_engine, read_pool_metrics, replica_health
+from app.database.slow_query_log import slow_query_log
+from app.Authentication.auth import require_admin
+from app.models.users import User
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+@router.get("/db-pool")
+async def db_pool_stats(
+    current_user: User = Depends(require_admin)
+) -> Dict[str, Any]:
+    """
+    Database connection pool metrics (Admin only)
+
+    - **checked_out** / **overflow**: connections in use now, and how many of
+      them are beyond DB_POOL_SIZE
+    - **wait**: how long checkouts waited for a connection (histogram);
+      **timeouts** counts waits that hit DB_POOL_TIMEOUT
+    - **routes**: how long each route held its connection, slowest total first
+    - **replica**: the same for the read replica pool, plus how many reads
+      it served vs. fell back to the primary (null without a replica)
+
+    Counters run since startup or the last reset.
+    """
+    stats = pool_metrics.stats(engine.sync_engine.pool)
+    stats["replica"] = None
+    if read_engine is not None:
+        stats["replica"] = {
+            **read_pool_metrics.stats(read_engine.sync_engine.pool),
+            "routing": replica_health.stats()
+        }
+    return stats
+
+
+@router.post("/db-pool/reset")
+async def reset_db_pool_stats(
+    current_user: User = Depends(require_admin)
+) -> Dict[str, Any]:
+    """Reset the pool counters (Admin only)"""
+    pool_metrics.reset()
+    if read_pool_metrics is not None:
+        read_pool_metrics.reset()
+    return {"success": True}
+
+
+SlowQuerySort = Literal["total_ms", "count", "avg_ms", "p95_ms", "max_ms"]
+
+
+@router.get("/slow-queries")
+async def slow_queries(
+    limit: int = Query(20, ge=1, le=500, description="Number of statement shapes to return"),
+    sort: SlowQuerySort = Query("total_ms", description="Order by this field, descending"),
+    current_user: User = Depends(require_admin)
+) -> Dict[str, Any]:
+    """
+    Slowest SQL statement shapes since startup or the last reset (Admin only)
+
+    Statements slower than SLOW_QUERY_MS are grouped by fingerprint
+    (literals / bind values stripped). Each entry has count, total, p50 /
+    p95 / max time, and the call sites and routes that ran it.
+    """
+    return slow_query_log.report(limit=limit, sort=sort)
+
+
+@router.get("/slow-queries/export")
+async def export_slow_queries(
+    format: Literal["json", "csv"] = Query("json", description="json or csv"),
+    sort: SlowQuerySort = Query("total_ms", description="Order by this field, descending"),
+    current_user: User = Depends(require_admin)
+) -> Response:
+    """
+    Download every captured statement shape as JSON or CSV (Admin only)
+    """
+    filename = f"slow-queries-{datetime.utcnow():%Y%m%d-%H%M%S}.{format}"
+    if format == "csv":
+        body, media_type = slow_query_log.to_csv(sort=sort), "text/csv"
+    else:
+        body, media_type = json.dumps(slow_query_log.report(limit=None, sort=sort), ensure_ascii=False), "application/json"
+
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post("/slow-queries/reset")
+async def reset_slow_queries(
+    current_user: User = Depends(require_admin)
+) -> Dict[str, Any]:
+    """Clear the slow-query log (Admin only)"""
+    slow_query_log.reset()
+    return {"success": True}
@@ -1,5 +1,8 @@
 import os
-from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Cookie, Depends, Header, HTTPException, Request, status, Response
+from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
@@ -9,7 +12,11 @@ from app.schemas.auth import LoginRequest, RegisterRequest
 from app.schemas.user import UserResponse
 from app.services.auth_service import AuthService
 from app.services.user_service import UserService
-from app.Authentication.auth import get_current_active_user
+from app.services.user_cache import user_cache
+from app.services.login_limiter import login_limiter
+from app.services.token_revocation import revocation_list
+from app.Authentication.auth import get_current_active_user, require_admin
+from app.Authentication.password import password_hasher
 from app.models.users import User
 
 logger = logging.getLogger(__name__)
@@ -96,13 +103,28 @@ async def register(
 @router.post("/login")
 async def login(
     credentials: LoginRequest,
+    request: Request,
     response: Response,  # ← IMPORTANT: Must have Response parameter
     db: AsyncSession = Depends(get_async_db)
 ):
-    """Login with username and password and set authentication cookie"""
+    """
+    Login with username and password and set authentication cookie
+    
+    Attempts are throttled per client IP and per username (429 + Retry-After).
+    """
     try:
         logger.info(f"Login attempt for username: {credentials.username}")
         
+        # Throttle before any database or bcrypt work
+        client_ip = request.client.host if request.client else None
+        wait = await login_limiter.check(client_ip, credentials.username)
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, please try again later",
+                headers={"Retry-After": login_limiter.retry_after_header(wait)}
+            )
+        
         # Authenticate user and get token
         token, user = await AuthService.login(
             db,
@@ -125,6 +147,8 @@ async def login(
         )
         # ====================================
         
+        await login_limiter.reset_user(credentials.username)
+        
         logger.info(f"User logged in successfully: {user.username}")
         
         return {
@@ -153,24 +177,51 @@ async def login(
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get current logged-in user information
     
     Requires valid JWT token (from cookie or Authorization header)
     """
+    if current_user.created_at is None:
+        # Built from token claims (AUTH_TRUST_TOKEN_CLAIMS); load the full record
+        return await user_cache.load(db, current_user.id)
     return current_user
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    authorization: Optional[str] = Header(None),
+    jwt_auth_token: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Logout user by clearing authentication cookie
+    Logout user: revoke the current token and clear the authentication cookie
     
-    Note: JWT tokens are stateless, so logout is handled client-side
-    by deleting the cookie
+    The token's id (jti) is added to the revocation list, so a copied token
+    stops working too.
     """
+    token = jwt_auth_token
+    if authorization and authorization.lower().startswith("bearer "):
+        token = authorization.split(None, 1)[1]
+    
+    if token:
+        try:
+            payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        except JWTError:
+            payload = None  # Expired / invalid: nothing to revoke
+        
+        if payload and payload.get("jti"):
+            await revocation_list.revoke(
+                db,
+                jti=payload["jti"],
+                expires_at=datetime.utcfromtimestamp(payload["exp"]),
+                user_id=payload.get("id")
+            )
+    
     response.delete_cookie(
         key="jwt_auth_token",
         path="/",
@@ -193,16 +244,29 @@ async def refresh_token(
     """
     Refresh JWT token
     
-    Requires valid JWT token and returns new token
+    Requires valid JWT token and returns new token. The new token's claims
+    come from the database, not the current token, so role changes and
+    deactivations apply; inactive or deleted users get 401.
     """
+    # Re-read the user: current_user may be built from the token's own claims
+    user = await UserService.get_user_by_id(db, current_user.id)
+    if user is None or not user.is_active:
+        logger.warning("Token refresh rejected for missing or inactive user", extra={"user_id": current_user.id})
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user_cache.set(user)
+    
     try:
         # Create new token
         new_token = AuthService.create_access_token(
-            user_id=current_user.id,
-            username=current_user.username,
-            permission=current_user.permission,
-            role=current_user.role,
-            is_active=current_user.is_active
+            user_id=user.id,
+            username=user.username,
+            permission=user.permission,
+            role=user.role,
+            is_active=user.is_active
         )
         
         # Set new cookie
@@ -211,10 +275,10 @@ async def refresh_token(
         return {
             "message": "Token refreshed successfully",
             "user": {
-                "id": current_user.id,
-                "username": current_user.username,
-                "permission": current_user.permission,
-                "role": current_user.role
+                "id": user.id,
+                "username": user.username,
+                "permission": user.permission,
+                "role": user.role
             }
         }
         
@@ -247,6 +311,16 @@ async def test_auth(
     }
 
 
+@router.get("/password-pool")
+async def password_pool_stats(
+    current_user: User = Depends(require_admin)
+):
+    """
+    bcrypt worker pool metrics: queue depth, wait and run times (Admin only)
+    """
+    return password_hasher.stats()
+
+
 @router.get("/debug-headers")
 async def debug_headers(request: Request):
     """
@@ -1,13 +1,16 @@
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
-from app.database.database import get_async_db
+from app.database.database import get_async_db, get_async_read_db
 from app.Authentication.auth import get_current_active_user, require_admin
 from app.models import User
-from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
+from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate, CategoryBulkUpdate
+from app.schemas.responses import PaginatedResponse
 from app.services.category_service import CategoryService
+from app.services.category_cache import category_cache
+from app.services.http_cache import check_not_modified
 
 logger = logging.getLogger(__name__)
 
@@ -59,11 +62,13 @@ async def create_category(
 
 @router.get("/", response_model=List[CategoryResponse])
 async def get_categories(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum records to return"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     search: Optional[str] = Query(None, max_length=100, description="Search term"),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get all categories with optional filtering
@@ -75,9 +80,15 @@ async def get_categories(
     - **search**: Search in category name and description
     
     **Public endpoint** - No authentication required
+    
+    Supports conditional GET (ETag / If-None-Match).
     """
 
     try:
+        not_modified = await check_not_modified(request, response, db)
+        if not_modified:
+            return not_modified
+        
         logger.info(f"Retrieved  categories ")
         categories, total = await CategoryService.get_all_categories(
             db=db,
@@ -98,8 +109,56 @@ async def get_categories(
         )
 
 
+@router.get("/page", response_model=PaginatedResponse[CategoryResponse])
+async def get_categories_page(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    search: Optional[str] = Query(None, max_length=100, description="Search term"),
+    cursor: Optional[str] = Query(None, max_length=500, description="next_cursor from the previous page (\"\" for the first)"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Get one page of categories with pagination metadata
+    
+    Page and total come from a single query. Pass **cursor** instead of
+    **skip** for keyset pagination (ordered by name, no total).
+    
+    **Public endpoint** - No authentication required
+    
+    Supports conditional GET (ETag / If-None-Match).
+    """
+    try:
+        not_modified = await check_not_modified(request, response, db)
+        if not_modified:
+            return not_modified
+        
+        page = await CategoryService.get_categories_page(
+            db=db,
+            skip=skip,
+            limit=limit,
+            is_active=is_active,
+            search=search,
+            cursor=cursor
+        )
+        return page.to_response()
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching categories page: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch categories"
+        )
+
+
 @router.get("/active", response_model=List[CategoryResponse])
 async def get_active_categories(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_async_db)
 ):
     """
@@ -109,8 +168,14 @@ async def get_active_categories(
     
     **Public endpoint** - No authentication required
     **Use this endpoint for category dropdowns in forms**
+    
+    Supports conditional GET (ETag / If-None-Match).
     """
     try:
+        not_modified = await check_not_modified(request, response, db)
+        if not_modified:
+            return not_modified
+        
         categories = await CategoryService.get_active_categories(db=db)
         
         logger.info(f"Retrieved {len(categories)} active categories")
@@ -125,18 +190,40 @@ async def get_active_categories(
 
 
 
+@router.get("/stats")
+async def get_all_category_statistics(
+    is_active: Optional[bool] = Query(None, description="Filter by category active status"),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Get statistics for every category in one query (admin dashboard)
+    
+    Same fields as /{category_id}/stats, for all categories.
+    
+    **Requires:** Authentication
+    """
+    try:
+        stats = await CategoryService.get_all_category_stats(db, is_active=is_active)
+        return stats
+        
+    except Exception as e:
+        logger.error(f"Error fetching category statistics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch category statistics"
+        )
+
+
+
 @router.get("/{category_id}")
 async def get_category_by_id(
     category_id: int,
     db: AsyncSession = Depends(get_async_db)
 ):
-    """Get category by ID with creator information"""
+    """Get category by ID with creator information (served from the in-process category cache)"""
     try:
-        category = await CategoryService.get_category_by_id(
-            db=db,
-            category_id=category_id,
-            include_creator=True
-        )
+        category = await category_cache.get_detail(db, category_id)
         
         if not category:
             raise HTTPException(
@@ -144,28 +231,7 @@ async def get_category_by_id(
                 detail=f"Category with id {category_id} not found"
             )
         
-        # Manually construct response to avoid circular import
-        return {
-            "id": category.id,
-            "category_name": category.category_name,
-            "description": category.description,
-            "icon": category.icon,
-            "color_code": category.color_code,
-            "sort_order": category.sort_order,
-            "is_active": category.is_active,
-            "created_at": category.created_at,
-            "created_by": category.created_by,
-            "updated_at": category.updated_at,
-            "creator": {
-                "id": category.creator.id,
-                "username": category.creator.username,
-                "permission": category.creator.permission,
-                "role": category.creator.role,
-                "is_active": category.creator.is_active,
-                "created_at": category.creator.created_at,
-                "updated_at": category.creator.updated_at
-            } if category.creator else None
-        }
+        return category
         
     except HTTPException:
         raise
@@ -180,6 +246,48 @@ async def get_category_by_id(
 
 
 
+@router.patch("/bulk", response_model=List[CategoryResponse])
+async def bulk_update_categories(
+    bulk_data: CategoryBulkUpdate,
+    current_user: User = Depends(require_admin),  # Only admins can update
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Update many categories at once (Admin only)
+    
+    Use for drag-and-drop reordering or batch activation instead of one
+    PUT per row. Each item has an **id** plus any fields of the single
+    update; all items are applied in one transaction, or none are.
+    
+    - **items**: 1-100 changes, e.g. `[{"id": 3, "sort_order": 1}, {"id": 1, "sort_order": 2}]`
+    
+    Renames may swap names between categories in the same batch. Returns 409
+    if another write took one of the new names concurrently.
+    
+    **Requires:** Admin permission
+    """
+    try:
+        logger.info(f"Admin {current_user.username} bulk updating {len(bulk_data.items)} categories")
+        
+        categories = await CategoryService.bulk_update_categories(
+            db=db,
+            items=bulk_data.items,
+            user_id=current_user.id
+        )
+        
+        logger.info(f"Bulk updated {len(categories)} categories")
+        return categories
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error bulk updating categories: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update categories"
+        )
+
+
 @router.put("/{category_id}", response_model=CategoryResponse)
 async def update_category(
     category_id: int,
@@ -288,7 +396,7 @@ async def toggle_category_status(
 async def get_category_statistics(
     category_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get statistics for a category
@@ -0,0 +1,36 @@
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.database import get_async_db
+from app.services.change_feed_service import ChangeFeedService
+
+router = APIRouter(prefix="/api/changes", tags=["Changes"])
+
+
+@router.get("")
+async def get_changes(
+    since: Optional[int] = Query(None, ge=0, description="Token returned by the previous call"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum change log entries per call"),
+    db: AsyncSession = Depends(get_async_db)
+) -> Dict[str, Any]:
+    """
+    Delta sync for polling clients (wall displays, frontend)
+    
+    - Without **since**: returns the current token only. Load the full data once
+      (e.g. /api/media/current-month), then poll with that token.
+    - With **since**: returns media / categories changed after the token, each
+      once in its current state ({"id": ..., "deleted": true} if removed),
+      plus **next_token** for the next call. Keep calling while **has_more**.
+    
+    When nothing changed the response is a few bytes.
+    
+    **Public endpoint** - No authentication required
+    """
+    if since is None:
+        token = await ChangeFeedService.current_token(db)
+        return {"success": True, "next_token": token, "has_more": False, "media": [], "categories": []}
+    
+    changes = await ChangeFeedService.get_changes(db, since=since, limit=limit)
+    
+    return {"success": True, **changes}
@@ -0,0 +1,45 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.database import get_async_db
+from app.services.home_service import HomeService
+from app.services.http_cache import check_not_modified
+
+router = APIRouter(prefix="/api/home", tags=["Home"])
+
+
+@router.get("")
+async def get_home(
+    request: Request,
+    response: Response,
+    per_category: int = Query(6, ge=1, le=20, description="Latest media items per category"),
+    db: AsyncSession = Depends(get_async_db)
+) -> Response:
+    """
+    Everything the landing page needs for first paint, in one request
+    
+    Returns:
+    - **categories**: active categories (sort_order, name), each with its latest
+      `per_category` active media and their file paths
+    - **ticker**: current-month titles for the news ticker (newest first)
+    
+    Built with one database round trip and served as pre-serialized JSON,
+    cached until the next media / category write.
+    
+    Supports conditional GET (ETag / If-None-Match).
+    
+    **Public endpoint** - No authentication required
+    """
+    not_modified = await check_not_modified(request, response, db, date.today().replace(day=1))
+    if not_modified:
+        return not_modified
+    
+    body = await HomeService.get_home_payload(db, per_category=per_category)
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=dict(response.headers)
+    )
@@ -1,12 +1,16 @@
 # app/routes/media.py (UPDATED VERSION)
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.database.database import get_async_db
+from app.database.database import get_async_db, get_async_read_db
 from app.models.media import Media
 from app.models.categories import Category
-from app.schemas.media import  MediaResponse
 from app.schemas.responses import SuccessResponse, ErrorResponse, PaginatedResponse
 from app.services.media_service import MediaService
+from app.services.search_service import media_search_index
+from app.services.suggest_service import title_suggest_index
+from app.services.event_broadcaster import media_events
+from app.services.http_cache import check_not_modified
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
@@ -16,9 +20,11 @@ router = APIRouter(prefix="/api/media", tags=["media"])
 
 @router.get("/current-month")
 async def get_media_current_month(
+    request: Request,
+    response: Response,
     category_id: int = Query(None, description="Optional: Filter by category ID"),
     media_type: str = Query(None, description="Optional: Filter by type - 'image' or 'video'"),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ) -> Dict[str, Any]:
     """
     Get ALL media from current month (Nov 1-30, 2025) with all images/videos paths
@@ -34,8 +40,16 @@ async def get_media_current_month(
     - GET /api/media/current-month?category_id=1
     - GET /api/media/current-month?media_type=image
     - GET /api/media/current-month?category_id=1&media_type=image
+    
+    Supports conditional GET: send the returned ETag as If-None-Match to get
+    304 Not Modified while nothing changed.
     """
     
+    # 304 before any row fetch / serialization if the client copy is current
+    not_modified = await check_not_modified(request, response, db, date.today().replace(day=1))
+    if not_modified:
+        return not_modified
+    
     # Get all media from current month
     media_list, start_date, end_date = await MediaService.get_media_current_month(
         db,
@@ -44,29 +58,7 @@ async def get_media_current_month(
     )
     
     # Build response with paths and category_name
-    data = []
-    for media in media_list:
-        media_data = MediaResponse.from_orm(media).dict()
-        
-        # Add category_name
-        media_data["category_name"] = media.category.category_name if media.category else None
-        
-        # Add paths to response
-        media_data["paths"] = [
-            {
-                "id": path.id,
-                "file_path": path.file_path,
-                "file_name": path.file_name,
-                "file_size": path.file_size,
-                "file_extension": path.file_extension,
-                "mime_type": path.mime_type,
-                "is_primary": path.is_primary,
-                "created_at": path.created_at.isoformat() if path.created_at else None
-            }
-            for path in media.paths
-        ]
-        
-        data.append(media_data)
+    data = [MediaService.to_response_dict(media) for media in media_list]
     
     # Return simple response (no pagination)
     return {
@@ -83,9 +75,11 @@ async def get_media_current_month(
 
 @router.get("/current-month/titles")
 async def get_current_month_titles(
+    request: Request,
+    response: Response,
     category_id: int = Query(None, description="Optional: Filter by category ID"),
     media_type: str = Query(None, description="Optional: Filter by type - 'image' or 'video'"),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ) -> Dict[str, Any]:
     """
     Get ONLY titles and basic info from current month
@@ -99,8 +93,14 @@ async def get_current_month_titles(
     - GET /api/media/current-month/titles
     - GET /api/media/current-month/titles?category_id=1
     - GET /api/media/current-month/titles?media_type=image
+    
+    Supports conditional GET (ETag / If-None-Match).
     """
     
+    not_modified = await check_not_modified(request, response, db, date.today().replace(day=1))
+    if not_modified:
+        return not_modified
+    
     titles, start_date, end_date = await MediaService.get_current_month_titles_only(
         db,
         category_id=category_id,
@@ -115,4 +115,144 @@ async def get_current_month_titles(
             "start": start_date.isoformat(),
             "end": end_date.isoformat()
         }
-    }
\ No newline at end of file
+    }
+
+
+
+@router.get("/search")
+async def search_media(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text (Arabic or English)"),
+    category_id: int = Query(None, description="Optional: Filter by category ID"),
+    media_type: str = Query(None, description="Optional: Filter by type - 'image' or 'video'"),
+    skip: int = Query(0, ge=0, description="Number of ranked results to skip"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results to return")
+) -> Dict[str, Any]:
+    """
+    Full-text search over active media titles and descriptions
+    
+    Served from the in-memory inverted index (no database query). Arabic text is
+    normalized (diacritics, tatweel, alef/yaa/taa-marbuta forms) and lightly
+    stemmed, so "الشركة" also matches "شركات". Results are ranked by relevance.
+    
+    Example requests:
+    - GET /api/media/search?q=الصيانة
+    - GET /api/media/search?q=maintenance&media_type=image
+    """
+    results, total = media_search_index.search(
+        q,
+        limit=limit,
+        offset=skip,
+        category_id=category_id,
+        media_type=media_type
+    )
+    
+    return {
+        "success": True,
+        "data": results,
+        "total": total,
+        "query": q
+    }
+
+
+
+@router.get("/suggest")
+async def suggest_titles(
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    kind: Optional[str] = Query(None, alias="type", pattern="^(media|category)$", description="Optional: 'media' or 'category'"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions to return")
+) -> Dict[str, Any]:
+    """
+    Typeahead suggestions from active media titles and category names
+    
+    Served from the in-memory prefix index (no database query). Every typed word
+    must be the start of a word in the title; results are newest first.
+    Words shorter than 2 characters return no suggestions.
+    
+    Example requests:
+    - GET /api/media/suggest?q=صيا
+    - GET /api/media/suggest?q=حفل تك&type=media
+    """
+    suggestions = title_suggest_index.suggest(q, limit=limit, kind=kind)
+    
+    return {
+        "success": True,
+        "data": suggestions,
+        "total": len(suggestions)
+    }
+
+
+
+@router.get("/facets")
+async def get_media_facets(
+    request: Request,
+    response: Response,
+    category_id: int = Query(None, description="Optional: Filter by category ID"),
+    media_type: str = Query(None, description="Optional: Filter by type - 'image' or 'video'"),
+    start_date: Optional[date] = Query(None, description="Optional: Created on/after (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Optional: Created on/before (YYYY-MM-DD)"),
+    is_active: Optional[bool] = Query(True, description="Filter by active status (default: true)"),
+    db: AsyncSession = Depends(get_async_db)
+) -> Dict[str, Any]:
+    """
+    Get media counts grouped by category, media type and month
+    
+    One database round trip (GROUP BY GROUPING SETS), cached until the next
+    write. Enough to render a complete browse / filter sidebar.
+    
+    Example requests:
+    - GET /api/media/facets
+    - GET /api/media/facets?media_type=image&start_date=2025-01-01
+    
+    Supports conditional GET (ETag / If-None-Match).
+    """
+    not_modified = await check_not_modified(request, response, db)
+    if not_modified:
+        return not_modified
+    
+    facets = await MediaService.get_facets(
+        db,
+        category_id=category_id,
+        media_type=media_type,
+        start_date=start_date,
+        end_date=end_date,
+        is_active=is_active
+    )
+    
+    return {
+        "success": True,
+        "data": facets
+    }
+
+
+
+@router.get("/events")
+async def media_event_stream(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    last_event_id_param: Optional[str] = Query(None, alias="last_event_id", description="Resume point (for clients that can't send headers)")
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of media / category changes (for displays)
+    
+    Events:
+    - **media.created**: {id, title, category_id, media_type, is_active, created_at, files}
+    - **category.toggled**: {id, category_name, is_active}
+    - **categories.updated**: {ids} - bulk category edit (reorder, rename, ...); reload those categories
+    - **reset**: the client missed events - reload (or sync via /api/changes)
+    
+    A comment heartbeat is sent every SSE_HEARTBEAT_SECONDS. Browsers reconnect
+    automatically and resume with the Last-Event-ID header.
+    
+    Usage: `new EventSource("/api/media/events")`
+    """
+    return StreamingResponse(
+        media_events.stream(
+            last_event_id=last_event_id or last_event_id_param,
+            is_disconnected=request.is_disconnected
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        }
+    )
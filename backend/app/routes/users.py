@@ -1,10 +1,11 @@
 
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.database import get_async_db
 from app.schemas.user import UserResponse, UserUpdate
+from app.schemas.responses import PaginatedResponse
 from app.services.user_service import UserService
 from app.Authentication.auth import get_current_active_user
 from app.models.users import User
@@ -31,6 +32,25 @@ async def get_all_users(
     return users
 
 
+@router.get("/page", response_model=PaginatedResponse[UserResponse])
+async def get_users_page(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=500),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get one page of users with pagination metadata
+    
+    Pass cursor ("" for the first page) for keyset pagination without a total.
+    
+    Requires authentication
+    """
+    page = await UserService.get_users_page(db, skip, limit, cursor)
+    return page.to_response()
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user_by_id(
     user_id: int,
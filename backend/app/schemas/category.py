@@ -28,6 +28,24 @@ class CategoryUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class CategoryBulkItem(CategoryUpdate):
+    """One row of a bulk category update"""
+    id: int
+
+
+class CategoryBulkUpdate(BaseModel):
+    """Schema for updating many categories at once (e.g. reorder)"""
+    items: list[CategoryBulkItem] = Field(..., min_length=1, max_length=100)
+
+    @field_validator("items")
+    @classmethod
+    def unique_ids(cls, items: list[CategoryBulkItem]) -> list[CategoryBulkItem]:
+        ids = [item.id for item in items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each category id may appear only once")
+        return items
+
+
 class CategoryResponse(CategoryBase):
     """Schema for Category response"""
     id: int
@@ -43,12 +43,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response schema"""
     success: bool = Field(default=True, description="Success status")
     data: List[T] = Field(default_factory=list, description="List of items")
-    total: int = Field(default=0, description="Total number of items")
-    page: int = Field(default=1, description="Current page number")
+    total: Optional[int] = Field(default=0, description="Total number of items (null in cursor mode)")
+    page: Optional[int] = Field(default=1, description="Current page number (null in cursor mode)")
     limit: int = Field(default=10, description="Items per page")
-    total_pages: int = Field(default=0, description="Total number of pages")
+    total_pages: Optional[int] = Field(default=0, description="Total number of pages (null in cursor mode)")
     has_next: bool = Field(default=False, description="Has next page")
     has_previous: bool = Field(default=False, description="Has previous page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (cursor mode)")
     
     class Config:
         json_schema_extra = {
@@ -60,6 +61,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
                 "limit": 10,
                 "total_pages": 10,
                 "has_next": True,
-                "has_previous": False
+                "has_previous": False,
+                "next_cursor": None
             }
         }
\ No newline at end of file
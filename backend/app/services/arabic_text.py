@@ -0,0 +1,111 @@
+import re
+from typing import List
+
+
+# ========== Arabic normalization tables ==========
+
+# Harakat, tanween, shadda, sukun, superscript alef and Quranic annotation marks
+_DIACRITICS_RE = re.compile("[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED]")
+
+_TATWEEL = "\u0640"
+
+_CHAR_MAP = str.maketrans({
+    # Alef forms (أ إ آ ٱ) -> bare alef
+    "\u0623": "\u0627",
+    "\u0625": "\u0627",
+    "\u0622": "\u0627",
+    "\u0671": "\u0627",
+    # Alef maksura / farsi yeh (ى ی) -> yaa
+    "\u0649": "\u064A",
+    "\u06CC": "\u064A",
+    # Taa marbuta (ة) -> haa
+    "\u0629": "\u0647",
+    # Hamza carriers (ؤ ئ) -> waw / yaa
+    "\u0624": "\u0648",
+    "\u0626": "\u064A",
+    # Arabic-Indic digits -> ASCII digits
+    **{chr(0x0660 + digit): str(digit) for digit in range(10)},
+})
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Light stemming affixes (longest first), already in normalized form
+_PREFIXES = ("وال", "بال", "كال", "فال", "لل", "ال", "و")
+_SUFFIXES = ("ها", "ان", "ات", "ون", "ين", "يه", "ه", "ي")
+
+# Very common words that carry no meaning for ranking
+STOP_WORDS = frozenset({
+    "في", "من", "علي", "الي", "عن", "مع", "هذا", "هذه", "ذلك", "التي", "الذي",
+    "و", "او", "ثم", "قد", "كل", "the", "a", "an", "of", "and", "in", "on", "to",
+})
+
+
+def normalize_arabic(text: str) -> str:
+    """
+    Normalize text for matching (Arabic-aware)
+
+    - Strips diacritics and tatweel
+    - Unifies alef / yaa / taa-marbuta / hamza-carrier forms
+    - Converts Arabic-Indic digits and lowercases Latin text
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    if not text:
+        return ""
+
+    text = _DIACRITICS_RE.sub("", text)
+    text = text.replace(_TATWEEL, "")
+    text = text.translate(_CHAR_MAP)
+    return text.casefold()
+
+
+def light_stem(token: str) -> str:
+    """
+    Strip one common prefix and one common suffix (light stemming)
+
+    Only Arabic affixes are removed, and only while at least 3 letters remain,
+    so short words and Latin tokens are returned unchanged.
+
+    Args:
+        token: Normalized token
+
+    Returns:
+        Stemmed token
+    """
+    for prefix in _PREFIXES:
+        if token.startswith(prefix) and len(token) - len(prefix) >= 3:
+            token = token[len(prefix):]
+            break
+
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+
+    return token
+
+
+def tokenize(text: str, stem: bool = True) -> List[str]:
+    """
+    Split text into normalized (and optionally stemmed) terms
+
+    Args:
+        text: Raw text
+        stem: Apply light stemming to each token
+
+    Returns:
+        List of terms in order of appearance (stop words removed)
+    """
+    tokens = _TOKEN_RE.findall(normalize_arabic(text))
+    terms = []
+
+    for token in tokens:
+        if token in STOP_WORDS:
+            continue
+        terms.append(light_stem(token) if stem else token)
+
+    return terms
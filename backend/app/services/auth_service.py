@@ -1,3 +1,5 @@
+import uuid
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
@@ -6,9 +8,11 @@ from sqlalchemy import select, func
 from fastapi import HTTPException, status
 
 from app.models import User
-from app.Authentication.password import hash_password, verify_password
+from app.models.users import normalize_username
+from app.Authentication.password import password_hasher
 from app.database.config import settings
 from app.schemas.auth import Token, RegisterRequest
+from app.services.write_behind import write_behind
 
 
 class AuthService:
@@ -49,7 +53,9 @@ class AuthService:
             "permission": permission,
             "role": role,
             "is_active": is_active,
-            "exp": expire
+            "exp": expire,
+            "iat": time.time(),  # Float: compared with user write times (UserCache.written_since)
+            "jti": uuid.uuid4().hex  # Token id, for revocation on logout
         }
         
         encoded_jwt = jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
@@ -64,9 +70,9 @@ class AuthService:
         """
         Authenticate user with username and password
         """
-        # Get user by username (case-insensitive)
+        # Get user by username (case-insensitive, index seek on username_key)
         result = await db.execute(
-            select(User).where(User.username.ilike(username))
+            select(User).where(User.username_key == normalize_username(username))
         )
         user = result.scalar_one_or_none()
         
@@ -74,12 +80,11 @@ class AuthService:
             return None
         
         # Verify password
-        if not verify_password(password, user.password):
+        if not await password_hasher.verify(password, user.password):
             return None
         
-        # Update last login
-        user.last_login = datetime.utcnow()
-        await db.commit()
+        # Record last login off the request path (read-only login transaction)
+        write_behind.set_value(User, "last_login", user.id, datetime.utcnow())
         
         return user
     
@@ -149,7 +154,7 @@ class AuthService:
         """
         # Check if username already exists (case-insensitive)
         result = await db.execute(
-            select(User).where(User.username.ilike(user_data.username))
+            select(User).where(User.username_key == normalize_username(user_data.username))
         )
         existing_user = result.scalar_one_or_none()
         
@@ -160,7 +165,7 @@ class AuthService:
             )
         
         # Create new user
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await password_hasher.hash(user_data.password)
         
         new_user = User(
             username=user_data.username.lower().strip(),
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class VersionedCache:
+    """
+    Small process-local cache invalidated by a global write version
+
+    Every media / category write path calls bump(); entries stored under an
+    older version are treated as misses, so cached read results live exactly
+    until the next write. Least recently used entries are evicted beyond
+    max_entries.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._version = 0
+        self._entries: "OrderedDict[Hashable, tuple[int, Any]]" = OrderedDict()
+
+    @property
+    def version(self) -> int:
+        """Current write version"""
+        return self._version
+
+    def bump(self) -> int:
+        """Invalidate every cached entry (call after a committed write)"""
+        self._version += 1
+        self._entries.clear()
+        return self._version
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing / stale"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        version, value = entry
+        if version != self._version:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        """
+        Store value under key
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            version: Write version the value was computed at (defaults to the
+                current one). A value computed before a concurrent write is
+                dropped instead of being cached as fresh.
+        """
+        if version is not None and version != self._version:
+            return
+
+        self._entries[key] = (self._version, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Process-wide cache for read endpoints (facets, home page, ...)
+response_cache = VersionedCache()
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.database.config import settings
+from app.models.categories import Category
+from app.schemas.category import CategoryResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _detail_dict(category: Category) -> dict:
+    """Category with creator information (GET /api/categories/{id} shape)"""
+    creator = category.creator
+    return {
+        "id": category.id,
+        "category_name": category.category_name,
+        "description": category.description,
+        "icon": category.icon,
+        "color_code": category.color_code,
+        "sort_order": category.sort_order,
+        "is_active": category.is_active,
+        "created_at": category.created_at,
+        "created_by": category.created_by,
+        "updated_at": category.updated_at,
+        "creator": {
+            "id": creator.id,
+            "username": creator.username,
+            "permission": creator.permission,
+            "role": creator.role,
+            "is_active": creator.is_active,
+            "created_at": creator.created_at,
+            "updated_at": creator.updated_at
+        } if creator else None
+    }
+
+
+class CategoryCache:
+    """
+    In-process copy of the Categories table
+
+    Holds id -> category and the ordered active list as immutable
+    CategoryResponse snapshots. Loaded in lifespan, invalidated by the
+    category write paths (CategoryService._after_write) and reloaded lazily
+    on the next read. The TTL bounds staleness across worker processes,
+    whose writes don't invalidate this process.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._by_id: Dict[int, CategoryResponse] = {}
+        self._active: List[CategoryResponse] = []
+        self._details: Dict[int, dict] = {}
+        self._loaded_at: Optional[float] = None
+        self._generation = ""
+        # Bumped by invalidate(); a load that started before an invalidation
+        # doesn't store its (possibly pre-write) result
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def generation(self) -> str:
+        """Changes on every reload (usable as a validator)"""
+        return self._generation
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def load(self, db: AsyncSession) -> int:
+        """
+        (Re)load every category from the database
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of categories read (not stored if invalidated meanwhile)
+        """
+        version = self._version
+        result = await db.execute(
+            select(Category)
+            .options(selectinload(Category.creator))
+            .order_by(Category.sort_order.asc(), Category.category_name.asc())
+        )
+        categories = result.scalars().all()
+        snapshots = [CategoryResponse.model_validate(category) for category in categories]
+
+        if version != self._version:
+            # A write invalidated the cache while this query ran: the rows may
+            # predate it, so leave the cache stale and let the next read reload
+            logger.info("Category cache load discarded (invalidated during load)")
+            return len(snapshots)
+
+        self._by_id = {category.id: category for category in snapshots}
+        self._details = {category.id: _detail_dict(category) for category in categories}
+        self._active = [category for category in snapshots if category.is_active]
+        self._loaded_at = time.monotonic()
+        self._generation = f"{time.time():.6f}"
+
+        logger.info("Category cache loaded: %d categories (%d active)", len(self._by_id), len(self._active))
+        return len(self._by_id)
+
+    def invalidate(self) -> None:
+        """Drop the cached data (next read reloads)"""
+        self._version += 1
+        self._loaded_at = None
+
+    async def _ensure_loaded(self, db: AsyncSession) -> None:
+        if self._is_fresh():
+            return
+        async with self._lock:
+            if not self._is_fresh():  # Another request may have reloaded meanwhile
+                await self.load(db)
+
+    async def get(self, db: AsyncSession, category_id: int) -> Optional[CategoryResponse]:
+        """Get a category (active or not) by ID"""
+        await self._ensure_loaded(db)
+        return self._by_id.get(category_id)
+
+    async def get_detail(self, db: AsyncSession, category_id: int) -> Optional[dict]:
+        """Get a category with creator information by ID"""
+        await self._ensure_loaded(db)
+        return self._details.get(category_id)
+
+    async def get_active(self, db: AsyncSession) -> List[CategoryResponse]:
+        """Get active categories ordered by sort_order, then name"""
+        await self._ensure_loaded(db)
+        return self._active
+
+
+# Process-wide category cache
+category_cache = CategoryCache(ttl_seconds=settings.CATEGORY_CACHE_TTL_SECONDS)
@@ -1,17 +1,42 @@
 
 from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, and_, or_, desc, case, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
+from app.database.types import utcnow
 from app.models import Category, User
-from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
+from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoryBulkItem
+from app.services.suggest_service import title_suggest_index
+from app.services.cache_service import response_cache
+from app.services.category_cache import category_cache
+from app.services.change_feed_service import ChangeFeedService
+from app.services.event_broadcaster import media_events
+from app.services.pagination import Page, paginate, paginate_cursor
 
 
 class CategoryService:
     """Service class for Category operations"""
     
+    @staticmethod
+    def _after_write(category: Category, deleted: bool = False) -> None:
+        """
+        Refresh in-memory read models after a committed category write
+        
+        Args:
+            category: The written category
+            deleted: True if the category row was removed
+        """
+        if deleted:
+            title_suggest_index.remove(title_suggest_index.CATEGORY, category.id)
+        else:
+            title_suggest_index.index_category(category)
+        
+        category_cache.invalidate()
+        response_cache.bump()
+    
     @staticmethod
     async def create_category(
         db: AsyncSession,
@@ -58,9 +83,14 @@ class CategoryService:
         )
         
         db.add(new_category)
+        await db.flush()  # Get new_category.id for the change log
+        
+        ChangeFeedService.record(db, ChangeFeedService.CATEGORY, new_category.id, "create")
         await db.commit()
         await db.refresh(new_category)
         
+        CategoryService._after_write(new_category)
+        
         return new_category
     
     @staticmethod
@@ -89,31 +119,13 @@ class CategoryService:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_all_categories(
-        db: AsyncSession,
-        skip: int = 0,
-        limit: int = 100,
+    def _list_query(
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
         include_creator: bool = False
-    ) -> Tuple[List[Category], int]:
-        """
-        Get all categories with optional filtering
-        
-        Args:
-            db: Database session
-            skip: Number of records to skip
-            limit: Maximum number of records to return
-            is_active: Filter by active status
-            search: Search term for category name or description
-            include_creator: Whether to include creator user data
-            
-        Returns:
-            Tuple of (categories list, total count)
-        """
-        # Build base query
+    ):
+        """Filtered category select() shared by the listing methods (no ORDER BY)"""
         query = select(Category)
-        count_query = select(func.count(Category.id))
         
         # Apply filters
         conditions = []
@@ -132,36 +144,99 @@ class CategoryService:
         
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
-        
-        # Get total count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-        
-        # Apply ordering (by sort_order, then by name)
-        query = query.order_by(Category.sort_order.asc(), Category.category_name.asc())
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
         
         # Include creator if requested
         if include_creator:
             query = query.options(selectinload(Category.creator))
         
-        # Execute query
-        result = await db.execute(query)
-        categories = result.scalars().all()
+        return query
+    
+    @staticmethod
+    async def get_categories_page(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_creator: bool = False
+    ) -> Page:
+        """
+        Get one page of categories with its total in a single query
+        
+        Offset mode is ordered by sort_order, then name. Cursor mode (when
+        `cursor` is given, or is "" for the first page) is ordered by name and
+        returns next_cursor instead of a total.
         
-        return list(categories), total
+        Args:
+            db: Database session
+            skip: Number of records to skip (offset mode)
+            limit: Maximum number of records to return
+            is_active: Filter by active status
+            search: Search term for category name or description
+            cursor: next_cursor of the previous page (cursor mode)
+            include_creator: Whether to include creator user data
+            
+        Returns:
+            Page of Category objects
+        """
+        query = CategoryService._list_query(is_active, search, include_creator)
+        
+        if cursor is not None:
+            return await paginate_cursor(
+                db,
+                query,
+                order_by=(Category.category_name, Category.id),
+                cursor=cursor,
+                limit=limit
+            )
+        
+        query = query.order_by(Category.sort_order.asc(), Category.category_name.asc(), Category.id.asc())
+        return await paginate(db, query, skip=skip, limit=limit)
+    
+    @staticmethod
+    async def get_all_categories(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        include_creator: bool = False
+    ) -> Tuple[List[Category], int]:
+        """
+        Get all categories with optional filtering
+        
+        Args:
+            db: Database session
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            is_active: Filter by active status
+            search: Search term for category name or description
+            include_creator: Whether to include creator user data
+            
+        Returns:
+            Tuple of (categories list, total count)
+        """
+        page = await CategoryService.get_categories_page(
+            db,
+            skip=skip,
+            limit=limit,
+            is_active=is_active,
+            search=search,
+            include_creator=include_creator
+        )
+        return page.items, page.total
     
     @staticmethod
     async def get_active_categories(
         db: AsyncSession,
         include_creator: bool = False
-    ) -> List[Category]:
+    ) -> List[CategoryResponse]:
         """
         Get all active categories (for dropdowns, etc.)
         
+        Served from the in-process category cache unless the creator is needed.
+        
         Args:
             db: Database session
             include_creator: Whether to include creator user data
@@ -169,6 +244,9 @@ class CategoryService:
         Returns:
             List of active Category objects
         """
+        if not include_creator:
+            return list(await category_cache.get_active(db))
+        
         query = select(Category).where(
             Category.is_active == True
         ).order_by(Category.sort_order.asc(), Category.category_name.asc())
@@ -234,13 +312,156 @@ class CategoryService:
                 setattr(category, field, value)
         
         # Update timestamp
-        category.updated_at = func.getutcdate()
+        category.updated_at = utcnow()
         
+        ChangeFeedService.record(db, ChangeFeedService.CATEGORY, category_id, "update")
         await db.commit()
         await db.refresh(category)
         
+        CategoryService._after_write(category)
+        
         return category
     
+    @staticmethod
+    async def bulk_update_categories(
+        db: AsyncSession,
+        items: List[CategoryBulkItem],
+        user_id: int
+    ) -> List[Category]:
+        """
+        Update many categories in one transaction (reorder, activate, rename, ...)
+        
+        Round trips don't grow with the number of rows: one query checks that
+        every id exists and that no new name collides with another category,
+        one UPDATE ... SET col = CASE id WHEN ... END writes all rows, then the
+        change log insert and a reload of the updated rows.
+        
+        The unique index on category_name is checked per row, so a rename
+        that takes a name another row in the batch gives up (a swap or chain)
+        runs in two phases: those rows get temporary names first.
+        
+        Args:
+            db: Database session
+            items: Per-category changes (id + any CategoryUpdate fields)
+            user_id: ID of user performing update
+            
+        Returns:
+            Updated Category objects, in request order
+            
+        Raises:
+            HTTPException: If a category is not found (404), a name conflicts
+                (400), or a concurrent write took a name meanwhile (409)
+        """
+        changes = {item.id: item.model_dump(exclude_unset=True, exclude={"id"}) for item in items}
+        ids = list(changes)
+        
+        new_names = {
+            category_id: data["category_name"]
+            for category_id, data in changes.items()
+            if data.get("category_name")
+        }
+        
+        lowered = [name.lower() for name in new_names.values()]
+        if len(lowered) != len(set(lowered)):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Duplicate category names in request"
+            )
+        
+        # Existence and name conflicts in one query
+        lookup = Category.id.in_(ids)
+        if lowered:
+            lookup = or_(lookup, func.lower(Category.category_name).in_(lowered))
+        result = await db.execute(select(Category.id, Category.category_name).where(lookup))
+        rows = result.all()
+        
+        found = {row.id for row in rows}
+        missing = [category_id for category_id in ids if category_id not in found]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Categories not found: {missing}"
+            )
+        
+        # Names held by rows renamed in this batch may be reused (see the
+        # two-phase rename below); names held by any other row conflict
+        conflicts = [
+            row.category_name for row in rows
+            if row.id not in new_names and row.category_name.lower() in lowered
+        ]
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Category '{conflicts[0]}' already exists"
+            )
+        
+        # One CASE expression per changed column; rows that don't set it keep their value
+        values = {}
+        for field in CategoryUpdate.model_fields:
+            whens = {
+                category_id: data[field]
+                for category_id, data in changes.items()
+                if field in data
+            }
+            if whens:
+                column = getattr(Category, field)
+                values[field] = case(whens, value=Category.id, else_=column)
+        
+        # Renamed rows whose new name is still held by another row of the batch
+        held = {
+            row.category_name.lower(): row.id for row in rows
+            if row.id in new_names
+        }
+        swapped = [
+            category_id for category_id, name in new_names.items()
+            if held.get(name.lower(), category_id) != category_id
+        ]
+        
+        try:
+            if swapped:
+                # Phase 1: move the renamed rows off their current names
+                await db.execute(
+                    update(Category)
+                    .where(Category.id.in_(list(new_names)))
+                    .values(category_name=case(
+                        {category_id: f"~bulk-{category_id}" for category_id in new_names},
+                        value=Category.id
+                    ))
+                    .execution_options(synchronize_session=False)
+                )
+            
+            if values:
+                await db.execute(
+                    update(Category)
+                    .where(Category.id.in_(ids))
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+            
+            for category_id in ids:
+                ChangeFeedService.record(db, ChangeFeedService.CATEGORY, category_id, "update")
+            await db.commit()
+        except IntegrityError:
+            # Another write took one of the names after the check above
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Category name conflict; reload the categories and retry"
+            )
+        
+        result = await db.execute(
+            select(Category)
+            .where(Category.id.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+        updated = {category.id: category for category in result.scalars().all()}
+        
+        for category in updated.values():
+            CategoryService._after_write(category)
+        media_events.publish("categories.updated", {"ids": ids})
+        
+        return [updated[category_id] for category_id in ids]
+    
     @staticmethod
     async def delete_category(
         db: AsyncSession,
@@ -286,9 +507,13 @@ class CategoryService:
             await db.delete(category)
         else:
             category.is_active = False
-            category.updated_at = func.getutcdate()
+            category.updated_at = utcnow()
         
+        ChangeFeedService.record(db, ChangeFeedService.CATEGORY, category_id, "delete")
         await db.commit()
+        
+        CategoryService._after_write(category, deleted=hard_delete)
+        
         return True
     
     @staticmethod
@@ -318,20 +543,63 @@ class CategoryService:
             )
         
         category.is_active = not category.is_active
-        category.updated_at = func.getutcdate()
+        category.updated_at = utcnow()
         
+        ChangeFeedService.record(db, ChangeFeedService.CATEGORY, category_id, "toggle")
         await db.commit()
         await db.refresh(category)
         
+        CategoryService._after_write(category)
+        media_events.publish("category.toggled", {
+            "id": category.id,
+            "category_name": category.category_name,
+            "is_active": category.is_active
+        })
+        
         return category
     
+    @staticmethod
+    def _stats_query():
+        """
+        Per-category media counts as one conditional aggregate
+        
+        Category LEFT JOIN Media, so categories without media get zeros.
+        """
+        from app.models import Media
+        
+        return (
+            select(
+                Category.id.label("category_id"),
+                Category.category_name,
+                func.count(Media.id).label("total_media"),
+                func.coalesce(func.sum(case((Media.is_active == True, 1), else_=0)), 0).label("active_media"),
+                func.coalesce(func.sum(case((Media.media_type == 'image', 1), else_=0)), 0).label("image_count"),
+                func.coalesce(func.sum(case((Media.media_type == 'video', 1), else_=0)), 0).label("video_count")
+            )
+            .select_from(Category)
+            .outerjoin(Media, Media.category_id == Category.id)
+            .group_by(Category.id, Category.category_name, Category.sort_order)
+        )
+    
+    @staticmethod
+    def _stats_to_dict(row) -> dict:
+        return {
+            "category_id": row.category_id,
+            "category_name": row.category_name,
+            "total_media": row.total_media,
+            "active_media": row.active_media,
+            "inactive_media": row.total_media - row.active_media,
+            "image_count": row.image_count,
+            "video_count": row.video_count
+        }
+    
     @staticmethod
     async def get_category_stats(
         db: AsyncSession,
         category_id: int
     ) -> dict:
         """
-        Get statistics for a category
+        Get statistics for a category (single query)
         
         Args:
             db: Database session
@@ -343,54 +611,41 @@ class CategoryService:
         Raises:
             HTTPException: If category not found
         """
-        category = await CategoryService.get_category_by_id(db, category_id)
+        result = await db.execute(
+            CategoryService._stats_query().where(Category.id == category_id)
+        )
+        row = result.one_or_none()
         
-        if not category:
+        if row is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category with id {category_id} not found"
             )
         
-        from app.models import Media
-        
-        # Count total media
-        total_media_result = await db.execute(
-            select(func.count(Media.id)).where(Media.category_id == category_id)
-        )
-        total_media = total_media_result.scalar_one()
-        
-        # Count active media
-        active_media_result = await db.execute(
-            select(func.count(Media.id)).where(
-                Media.category_id == category_id,
-                Media.is_active == True
-            )
-        )
-        active_media = active_media_result.scalar_one()
+        return CategoryService._stats_to_dict(row)
+    
+    @staticmethod
+    async def get_all_category_stats(
+        db: AsyncSession,
+        is_active: Optional[bool] = None
+    ) -> List[dict]:
+        """
+        Get statistics for all categories in one GROUP BY round trip
         
-        # Count by media type
-        image_count_result = await db.execute(
-            select(func.count(Media.id)).where(
-                Media.category_id == category_id,
-                Media.media_type == 'image'
-            )
+        Args:
+            db: Database session
+            is_active: Optional filter on category active status
+            
+        Returns:
+            List of statistics dictionaries, ordered by sort_order and name
+        """
+        query = CategoryService._stats_query().order_by(
+            Category.sort_order.asc(),
+            Category.category_name.asc()
         )
-        image_count = image_count_result.scalar_one()
         
-        video_count_result = await db.execute(
-            select(func.count(Media.id)).where(
-                Media.category_id == category_id,
-                Media.media_type == 'video'
-            )
-        )
-        video_count = video_count_result.scalar_one()
+        if is_active is not None:
+            query = query.where(Category.is_active == is_active)
         
-        return {
-            "category_id": category_id,
-            "category_name": category.category_name,
-            "total_media": total_media,
-            "active_media": active_media,
-            "inactive_media": total_media - active_media,
-            "image_count": image_count,
-            "video_count": video_count
-        }
\ No newline at end of file
+        result = await db.execute(query)
+        return [CategoryService._stats_to_dict(row) for row in result.all()]
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.database.config import settings
+from app.models.categories import Category
+from app.models.change_log import ChangeLog
+from app.models.media import Media
+from app.schemas.category import CategoryResponse
+
+
+class ChangeFeedService:
+    """Service for the monotonic change log and delta sync"""
+
+    MEDIA = "media"
+    CATEGORY = "category"
+
+    @staticmethod
+    def record(
+        db: AsyncSession,
+        entity_type: str,
+        entity_id: int,
+        action: str
+    ) -> None:
+        """
+        Add a change log row to the current transaction (does not commit)
+
+        Call right before the write's commit, so the row's id (the sync token)
+        is allocated as late as possible in the transaction.
+
+        Args:
+            db: Database session holding the write
+            entity_type: 'media' or 'category'
+            entity_id: ID of the changed row
+            action: 'create', 'update', 'toggle' or 'delete'
+        """
+        db.add(ChangeLog(entity_type=entity_type, entity_id=entity_id, action=action))
+
+    @staticmethod
+    def _settled_before() -> datetime:
+        return datetime.utcnow() - timedelta(seconds=settings.CHANGE_FEED_SETTLE_SECONDS)
+
+    @staticmethod
+    async def current_token(db: AsyncSession) -> int:
+        """Latest settled change id (0 if the log is empty)"""
+        result = await db.execute(
+            select(func.max(ChangeLog.id)).where(
+                ChangeLog.changed_at <= ChangeFeedService._settled_before()
+            )
+        )
+        return result.scalar_one() or 0
+
+    @staticmethod
+    async def latest_id(db: AsyncSession) -> int:
+        """Latest change id including unsettled rows (cheap global write version)"""
+        result = await db.execute(select(func.max(ChangeLog.id)))
+        return result.scalar_one() or 0
+
+    @staticmethod
+    async def get_changes(
+        db: AsyncSession,
+        since: int,
+        limit: int = 500
+    ) -> dict:
+        """
+        Get records changed after a sync token
+
+        Each changed entity is returned once, in its current state (or as
+        {"id": ..., "deleted": true} if the row is gone).
+
+        Args:
+            db: Database session
+            since: Token from the previous call (ChangeLog id)
+            limit: Maximum change log rows to consume per call
+
+        Returns:
+            Dictionary with next_token, has_more, media and categories lists
+        """
+        result = await db.execute(
+            select(ChangeLog.id, ChangeLog.entity_type, ChangeLog.entity_id, ChangeLog.action)
+            .where(
+                ChangeLog.id > since,
+                ChangeLog.changed_at <= ChangeFeedService._settled_before()
+            )
+            .order_by(ChangeLog.id.asc())
+            .limit(limit + 1)
+        )
+        rows = result.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if not rows:
+            return {"next_token": since, "has_more": False, "media": [], "categories": []}
+
+        media_ids: Dict[int, str] = {}
+        category_ids: Dict[int, str] = {}
+        for row in rows:
+            target = media_ids if row.entity_type == ChangeFeedService.MEDIA else category_ids
+            target[row.entity_id] = row.action  # last action wins
+
+        return {
+            "next_token": rows[-1].id,
+            "has_more": has_more,
+            "media": await ChangeFeedService._load_media(db, media_ids),
+            "categories": await ChangeFeedService._load_categories(db, category_ids)
+        }
+
+    @staticmethod
+    async def _load_media(db: AsyncSession, actions: Dict[int, str]) -> List[dict]:
+        if not actions:
+            return []
+
+        # Imported here: media_service imports this module for its write path
+        from app.services.media_service import MediaService
+
+        result = await db.execute(
+            select(Media)
+            .where(Media.id.in_(list(actions)))
+            .options(selectinload(Media.paths), selectinload(Media.category))
+        )
+        found = {media.id: media for media in result.scalars().all()}
+
+        records = []
+        for media_id, action in actions.items():
+            media = found.get(media_id)
+            if media is None:
+                records.append({"id": media_id, "deleted": True})
+            else:
+                records.append({**MediaService.to_response_dict(media), "action": action})
+        return records
+
+    @staticmethod
+    async def _load_categories(db: AsyncSession, actions: Dict[int, str]) -> List[dict]:
+        if not actions:
+            return []
+
+        result = await db.execute(
+            select(Category).where(Category.id.in_(list(actions)))
+        )
+        found = {category.id: category for category in result.scalars().all()}
+
+        records = []
+        for category_id, action in actions.items():
+            category = found.get(category_id)
+            if category is None:
+                records.append({"id": category_id, "deleted": True})
+            else:
+                records.append({
+                    **CategoryResponse.model_validate(category).model_dump(mode="json"),
+                    "action": action
+                })
+        return records
+
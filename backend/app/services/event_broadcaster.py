@@ -0,0 +1,156 @@
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.database.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EventBroadcaster:
+    """
+    Fan-out of compact Server-Sent Events to connected displays
+
+    Each event is serialized to an SSE frame once and shared by every
+    subscriber; a subscriber is just a small bounded asyncio.Queue, so idle
+    connections cost a parked coroutine each. Recent frames are kept in a ring
+    buffer for resume via Last-Event-ID.
+
+    Event ids are "<epoch>-<sequence>", where epoch identifies this worker
+    process. A client whose Last-Event-ID comes from another process, or has
+    fallen out of the buffer, gets a "reset" event and should resync (full
+    reload or /api/changes).
+    """
+
+    def __init__(
+        self,
+        history_size: int = 1000,
+        queue_size: int = 100,
+        heartbeat_seconds: float = 15.0,
+        retry_ms: int = 3000
+    ):
+        self.heartbeat_seconds = heartbeat_seconds
+        self.retry_ms = retry_ms
+        self._queue_size = queue_size
+        self._epoch = format(int(time.time() * 1000), "x")
+        self._sequence = 0
+        self._history: Deque[Tuple[int, bytes]] = deque(maxlen=history_size)
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._closed = False
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @staticmethod
+    def _frame(event_id: str, event: str, data: dict) -> bytes:
+        payload = json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":"))
+        return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+    def publish(self, event: str, data: dict) -> str:
+        """
+        Send an event to every connected subscriber
+
+        Subscribers whose queue is full (not reading) are disconnected; they
+        resume with Last-Event-ID on reconnect.
+
+        Args:
+            event: Event name, e.g. "media.created"
+            data: JSON-serializable payload (keep it small)
+
+        Returns:
+            The event id
+        """
+        self._sequence += 1
+        event_id = f"{self._epoch}-{self._sequence}"
+        frame = self._frame(event_id, event, data)
+        self._history.append((self._sequence, frame))
+
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop(queue)
+
+        return event_id
+
+    def _drop(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        # Make room for the end-of-stream marker
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _backlog(self, last_event_id: Optional[str]) -> Tuple[list, bool]:
+        """Frames after last_event_id, and whether the client must resync"""
+        if not last_event_id:
+            return [], False
+
+        epoch, _, sequence = last_event_id.partition("-")
+        if epoch != self._epoch or not sequence.isdigit():
+            return [], True
+
+        last_sequence = int(sequence)
+        if self._history and last_sequence < self._history[0][0] - 1:
+            return [], True
+
+        return [frame for seq, frame in self._history if seq > last_sequence], False
+
+    async def stream(
+        self,
+        last_event_id: Optional[str] = None,
+        is_disconnected=None
+    ) -> AsyncIterator[bytes]:
+        """
+        Async iterator of SSE frames for one client
+
+        Args:
+            last_event_id: Last-Event-ID sent by a reconnecting client
+            is_disconnected: Optional coroutine function (request.is_disconnected)
+                checked on every heartbeat
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        backlog, needs_reset = self._backlog(last_event_id)
+        self._subscribers.add(queue)
+
+        try:
+            yield f"retry: {self.retry_ms}\n\n".encode("utf-8")
+
+            if needs_reset:
+                yield self._frame(f"{self._epoch}-{self._sequence}", "reset", {"reason": "resync"})
+            for frame in backlog:
+                yield frame
+
+            while not self._closed:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout=self.heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    if is_disconnected is not None and await is_disconnected():
+                        break
+                    yield b": ping\n\n"
+                    continue
+
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            self._subscribers.discard(queue)
+
+    def close(self) -> None:
+        """End every open stream (called on shutdown)"""
+        self._closed = True
+        for queue in list(self._subscribers):
+            self._drop(queue)
+        logger.info("Event broadcaster closed")
+
+
+# Process-wide broadcaster for media / category events
+media_events = EventBroadcaster(
+    history_size=settings.SSE_HISTORY_SIZE,
+    heartbeat_seconds=settings.SSE_HEARTBEAT_SECONDS
+)
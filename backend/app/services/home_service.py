@@ -0,0 +1,201 @@
+import json
+from datetime import date, datetime
+from typing import Dict
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, case, desc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.categories import Category
+from app.models.media import Media
+from app.models.media_path import MediaPath
+from app.services.cache_service import response_cache
+
+
+class HomeService:
+    """Service for the landing page aggregate"""
+
+    @staticmethod
+    async def get_home_payload(
+        db: AsyncSession,
+        per_category: int = 6
+    ) -> bytes:
+        """
+        Build the serialized landing page payload in one database round trip
+
+        One statement returns every active category, its latest `per_category`
+        active media (ROW_NUMBER() OVER (PARTITION BY category_id ...)) with
+        their file paths, and the current-month titles for the news ticker.
+        The JSON bytes are cached in-process until the next write.
+
+        Args:
+            db: Database session
+            per_category: Number of latest media items per category
+
+        Returns:
+            UTF-8 encoded JSON payload
+        """
+        today = date.today()
+        month_start = datetime.combine(date(today.year, today.month, 1), datetime.min.time())
+
+        # The ticker window moves at month boundaries, so the month is part of the key
+        cache_key = ("home", per_category, month_start)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        version = response_cache.version
+
+        ranked = (
+            select(
+                Media.id,
+                Media.title,
+                Media.description,
+                Media.category_id,
+                Media.user_id,
+                Media.media_type,
+                Media.is_active,
+                Media.created_at,
+                Media.updated_at,
+                Media.updated_by,
+                func.row_number().over(
+                    partition_by=Media.category_id,
+                    order_by=(desc(Media.created_at), desc(Media.id))
+                ).label("rn")
+            )
+            .where(Media.is_active == True)
+            .subquery("ranked")
+        )
+
+        is_top = ranked.c.rn <= per_category
+        in_month = ranked.c.created_at >= month_start
+
+        query = (
+            select(
+                Category.id.label("cat_id"),
+                Category.category_name,
+                Category.description.label("category_description"),
+                Category.icon,
+                Category.color_code,
+                Category.sort_order,
+                ranked,
+                case((in_month, 1), else_=0).label("in_month"),
+                MediaPath.id.label("path_id"),
+                MediaPath.file_path,
+                MediaPath.file_name,
+                MediaPath.file_size,
+                MediaPath.file_extension,
+                MediaPath.mime_type,
+                MediaPath.is_primary,
+                MediaPath.created_at.label("path_created_at")
+            )
+            .select_from(Category)
+            # Top-N rows for the category sections + current month rows for the ticker
+            .outerjoin(
+                ranked,
+                and_(
+                    ranked.c.category_id == Category.id,
+                    or_(is_top, in_month)
+                )
+            )
+            # Paths are only needed for the category sections
+            .outerjoin(
+                MediaPath,
+                and_(MediaPath.media_id == ranked.c.id, is_top)
+            )
+            .where(Category.is_active == True)
+            .order_by(
+                Category.sort_order.asc(),
+                Category.category_name.asc(),
+                desc(ranked.c.created_at),
+                desc(ranked.c.id),
+                MediaPath.sort_order.asc()
+            )
+        )
+
+        result = await db.execute(query)
+
+        categories: Dict[int, dict] = {}
+        media_items: Dict[int, dict] = {}
+        ticker: Dict[int, dict] = {}
+
+        for row in result.all():
+            category = categories.get(row.cat_id)
+            if category is None:
+                category = categories[row.cat_id] = {
+                    "id": row.cat_id,
+                    "category_name": row.category_name,
+                    "description": row.category_description,
+                    "icon": row.icon,
+                    "color_code": row.color_code,
+                    "sort_order": row.sort_order,
+                    "media": []
+                }
+
+            if row.id is None:
+                continue
+
+            if row.in_month and row.id not in ticker:
+                ticker[row.id] = {
+                    "id": row.id,
+                    "title": row.title,
+                    "description": row.description,
+                    "category_id": row.category_id,
+                    "media_type": row.media_type,
+                    "created_at": row.created_at,
+                    "is_active": row.is_active
+                }
+
+            if row.rn > per_category:
+                continue
+
+            media = media_items.get(row.id)
+            if media is None:
+                media = media_items[row.id] = {
+                    "id": row.id,
+                    "title": row.title,
+                    "description": row.description,
+                    "category_id": row.category_id,
+                    "category_name": row.category_name,
+                    "user_id": row.user_id,
+                    "media_type": row.media_type,
+                    "is_active": row.is_active,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at,
+                    "updated_by": row.updated_by,
+                    "paths": []
+                }
+                category["media"].append(media)
+
+            if row.path_id is not None:
+                media["paths"].append({
+                    "id": row.path_id,
+                    "file_path": row.file_path,
+                    "file_name": row.file_name,
+                    "file_size": row.file_size,
+                    "file_extension": row.file_extension,
+                    "mime_type": row.mime_type,
+                    "is_primary": row.is_primary,
+                    "created_at": row.path_created_at
+                })
+
+        ticker_titles = sorted(ticker.values(), key=lambda item: item["created_at"], reverse=True)
+
+        payload = {
+            "success": True,
+            "data": {
+                "categories": list(categories.values()),
+                "ticker": ticker_titles
+            },
+            "per_category": per_category,
+            "generated_at": datetime.utcnow()
+        }
+
+        body = json.dumps(
+            jsonable_encoder(payload),
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+        response_cache.set(cache_key, body, version=version)
+        return body
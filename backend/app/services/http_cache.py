@@ -0,0 +1,74 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.config import settings
+from app.services.change_feed_service import ChangeFeedService
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from validator parts (version, filters, ...)"""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against etag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def cache_headers(etag: str) -> dict:
+    """ETag + revalidation policy shared by listing endpoints"""
+    return {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age=0, must-revalidate, "
+            f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+        ),
+    }
+
+
+async def check_not_modified(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    *parts
+) -> Optional[Response]:
+    """
+    Conditional GET for listing endpoints
+
+    The validator is the global write version (latest ChangeLog id) plus the
+    endpoint's own parts (path, filters, date window), so it costs one
+    primary-key MAX() lookup and no row fetch or serialization.
+
+    Sets ETag / Cache-Control on `response`. Returns a 304 response to send
+    as-is if the client's copy is current, otherwise None.
+
+    Args:
+        request: Incoming request (If-None-Match)
+        response: Response whose headers should carry the validator
+        db: Database session
+        parts: Extra validator parts (filters, date range, ...)
+    """
+    version = await ChangeFeedService.latest_id(db)
+    etag = make_etag(request.url.path, str(request.query_params), version, *parts)
+    headers = cache_headers(etag)
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
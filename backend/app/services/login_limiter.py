@@ -0,0 +1,197 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.database.config import settings
+from app.models.users import normalize_username
+
+logger = logging.getLogger(__name__)
+
+
+class LocalBucketStore:
+    """
+    Token buckets in a process-local, bounded LRU
+
+    Buckets are kept in access order: touching a key moves it to the end, and
+    past `max_keys` the least recently used ones are dropped, so a flood of
+    random usernames costs O(1) per attempt and bounded memory.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at, full_at), least recently used first
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+
+    def _evict(self, now: float) -> None:
+        # Drop the oldest buckets while over the cap, plus any at the front
+        # that have refilled completely (they carry no information)
+        while self._buckets:
+            oldest = next(iter(self._buckets.values()))
+            if len(self._buckets) <= self.max_keys and oldest[2] > now:
+                break
+            self._buckets.popitem(last=False)
+
+    async def take(self, key: str, capacity: float, rate: float) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        tokens = capacity if bucket is None else min(capacity, bucket[0] + (now - bucket[1]) * rate)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+
+        self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+        self._buckets.move_to_end(key)
+        self._evict(now)
+        return wait
+
+    async def reset(self, key: str) -> None:
+        self._buckets.pop(key, None)
+
+
+# Atomic refill + take; returns {allowed, seconds_to_wait}
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 't', 'u')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'u', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+if allowed == 1 then
+    return {1, '0'}
+end
+return {0, tostring((1 - tokens) / rate)}
+"""
+
+
+class RedisBucketStore:
+    """
+    Token buckets shared by every worker through Redis
+
+    Requires the optional `redis` package. If Redis is unreachable the
+    limiter falls back to the local store rather than blocking logins.
+    """
+
+    def __init__(self, url: str, prefix: str = "login-limit:"):
+        import redis.asyncio as redis  # Optional dependency
+
+        self.prefix = prefix
+        self._client = redis.from_url(url)
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, capacity: float, rate: float) -> float:
+        allowed, wait = await self._take(
+            keys=[self.prefix + key],
+            args=[capacity, rate, time.time()]
+        )
+        return 0.0 if int(allowed) else float(wait)
+
+    async def reset(self, key: str) -> None:
+        await self._client.delete(self.prefix + key)
+
+
+class LoginLimiter:
+    """
+    Token-bucket throttling of login attempts by client IP and by username
+
+    Checked before any database or bcrypt work, so a rejected attempt costs a
+    dict lookup. The per-username bucket is reset after a successful login,
+    so a user who mistypes a password a few times isn't locked out
+    afterwards.
+    """
+
+    def __init__(
+        self,
+        ip_burst: int = 20,
+        ip_per_minute: float = 20,
+        user_burst: int = 5,
+        user_per_minute: float = 2,
+        redis_url: Optional[str] = None,
+        enabled: bool = True
+    ):
+        self.enabled = enabled
+        self.ip_limit = (float(ip_burst), ip_per_minute / 60)
+        self.user_limit = (float(user_burst), user_per_minute / 60)
+        self.rejected = 0
+        self._local = LocalBucketStore()
+        self._store = self._local
+
+        if redis_url:
+            try:
+                self._store = RedisBucketStore(redis_url)
+            except ImportError:
+                logger.warning("LOGIN_RATE_LIMIT_REDIS_URL is set but redis is not installed; using in-process limits")
+
+    @staticmethod
+    def _user_key(username: str) -> str:
+        return "user:" + normalize_username(username)
+
+    async def _take(self, key: str, capacity: float, rate: float) -> float:
+        try:
+            return await self._store.take(key, capacity, rate)
+        except Exception as e:
+            if self._store is self._local:
+                raise
+            logger.warning(f"Shared login limit store failed ({e}); using in-process limits")
+            return await self._local.take(key, capacity, rate)
+
+    async def check(self, ip: Optional[str], username: str) -> float:
+        """
+        Take one attempt from the IP and username buckets
+
+        Args:
+            ip: Client address (None if unknown)
+            username: Submitted username
+
+        Returns:
+            0 if the attempt may proceed, otherwise seconds until it may be retried
+        """
+        if not self.enabled:
+            return 0.0
+
+        if ip:
+            wait = await self._take("ip:" + ip, *self.ip_limit)
+            if wait:
+                self.rejected += 1
+                return wait
+
+        wait = await self._take(self._user_key(username), *self.user_limit)
+        if wait:
+            self.rejected += 1
+        return wait
+
+    async def reset_user(self, username: str) -> None:
+        """Forget failed attempts for a username (after a successful login)"""
+        if not self.enabled:
+            return
+        try:
+            await self._store.reset(self._user_key(username))
+        except Exception as e:
+            logger.warning(f"Shared login limit store failed ({e})")
+
+    @staticmethod
+    def retry_after_header(wait: float) -> str:
+        return str(max(1, math.ceil(wait)))
+
+
+# Process-wide login limiter
+login_limiter = LoginLimiter(
+    ip_burst=settings.LOGIN_RATE_LIMIT_IP_BURST,
+    ip_per_minute=settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE,
+    user_burst=settings.LOGIN_RATE_LIMIT_USER_BURST,
+    user_per_minute=settings.LOGIN_RATE_LIMIT_USER_PER_MINUTE,
+    redis_url=settings.LOGIN_RATE_LIMIT_REDIS_URL,
+    enabled=settings.LOGIN_RATE_LIMIT_ENABLED
+)
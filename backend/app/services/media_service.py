@@ -2,13 +2,20 @@ from datetime import date, datetime
 from typing import List, Optional, Tuple
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, desc, select, func
+from sqlalchemy import and_, desc, select, func, extract, tuple_, null, union_all
 from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.orm import selectinload
 from app.models.media import Media 
 from app.models.categories import Category
 from app.models.media_path import MediaPath
+from app.schemas.media import MediaResponse
 from app.services.media_upload_service import MediaUploadService
+from app.services.search_service import media_search_index
+from app.services.suggest_service import title_suggest_index
+from app.services.cache_service import response_cache
+from app.services.category_cache import category_cache
+from app.services.change_feed_service import ChangeFeedService
+from app.services.event_broadcaster import media_events
 from app.database.config import settings
 from dateutil.relativedelta import relativedelta
 
@@ -16,6 +23,46 @@ from dateutil.relativedelta import relativedelta
 class MediaService:
     """Service class for Media operations"""
     
+    @staticmethod
+    def _after_write(media: Media) -> None:
+        """Refresh in-memory read models after a committed media write"""
+        media_search_index.index_media(media)
+        title_suggest_index.index_media(media)
+        response_cache.bump()
+    
+    @staticmethod
+    def to_response_dict(media: Media) -> dict:
+        """
+        Serialize a Media object (paths and category loaded) for list responses
+        
+        Args:
+            media: Media with paths and category relationships loaded
+            
+        Returns:
+            Dictionary with media fields, category_name and paths
+        """
+        media_data = MediaResponse.from_orm(media).dict()
+        
+        # Add category_name
+        media_data["category_name"] = media.category.category_name if media.category else None
+        
+        # Add paths
+        media_data["paths"] = [
+            {
+                "id": path.id,
+                "file_path": path.file_path,
+                "file_name": path.file_name,
+                "file_size": path.file_size,
+                "file_extension": path.file_extension,
+                "mime_type": path.mime_type,
+                "is_primary": path.is_primary,
+                "created_at": path.created_at.isoformat() if path.created_at else None
+            }
+            for path in media.paths
+        ]
+        
+        return media_data
+    
     @staticmethod
     async def create_media_with_files(
         db: AsyncSession,
@@ -46,16 +93,10 @@ class MediaService:
         Raises:
             HTTPException: If validation fails or file operations fail
         """
-        # Step 1: Verify category exists and is active
-        category_result = await db.execute(
-            select(Category).where(
-                Category.id == category_id,
-                Category.is_active == True
-            )
-        )
-        category = category_result.scalar_one_or_none()
+        # Step 1: Verify category exists and is active (in-process cache, no query)
+        category = await category_cache.get(db, category_id)
         
-        if not category:
+        if not category or not category.is_active:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category with id {category_id} not found or inactive"
@@ -133,7 +174,8 @@ class MediaService:
                 db.add(media_path)
                 media_paths.append(media_path)
             
-            # Step 7: Commit all changes to database
+            # Step 7: Record the change for delta-sync clients, then commit
+            ChangeFeedService.record(db, ChangeFeedService.MEDIA, new_media.id, "create")
             await db.commit()
             await db.refresh(new_media)
             
@@ -141,6 +183,18 @@ class MediaService:
             for mp in media_paths:
                 await db.refresh(mp)
             
+            # Step 9: Update search / suggest indexes and cached read results
+            MediaService._after_write(new_media)
+            media_events.publish("media.created", {
+                "id": new_media.id,
+                "title": new_media.title,
+                "category_id": new_media.category_id,
+                "media_type": new_media.media_type,
+                "is_active": new_media.is_active,
+                "created_at": new_media.created_at,
+                "files": len(media_paths)
+            })
+            
             return new_media, media_paths
             
         except HTTPException:
@@ -395,7 +449,119 @@ class MediaService:
             for row in rows
         ]
         
-        return titles, start_date, end_date        
-
+        return titles, start_date, end_date
 
+    @staticmethod
+    async def get_facets(
+        db: AsyncSession,
+        category_id: int = None,
+        media_type: str = None,
+        start_date: date = None,
+        end_date: date = None,
+        is_active: bool = True
+    ) -> dict:
+        """
+        Get media counts per category, per media type and per month
+        
+        All three facets come from one GROUP BY GROUPING SETS query. The result
+        is cached in-process until the next media / category write.
+        
+        Args:
+            db: Database session
+            category_id: Optional - filter by category
+            media_type: Optional - filter by type ('image' or 'video')
+            start_date: Optional - only media created on/after this date
+            end_date: Optional - only media created on/before this date
+            is_active: Filter by active status (None = all)
+            
+        Returns:
+            Dictionary with "categories", "media_types" and "months" facet lists
+        """
+        cache_key = ("facets", category_id, media_type, start_date, end_date, is_active)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        version = response_cache.version
+        
+        year = extract("year", Media.created_at)
+        month = extract("month", Media.created_at)
+        
+        filters = []
+        if is_active is not None:
+            filters.append(Media.is_active == is_active)
+        if category_id:
+            filters.append(Media.category_id == category_id)
+        if media_type:
+            filters.append(Media.media_type == media_type)
+        if start_date:
+            filters.append(Media.created_at >= datetime.combine(start_date, datetime.min.time()))
+        if end_date:
+            filters.append(Media.created_at <= datetime.combine(end_date, datetime.max.time()))
+        
+        grouped_columns = {
+            "category_id": Media.category_id,
+            "category_name": Category.category_name,
+            "media_type": Media.media_type,
+            "year": year,
+            "month": month
+        }
+        grouping_sets = [("category_id", "category_name"), ("media_type",), ("year", "month")]
+        
+        def facet_select(columns):
+            return (
+                select(*columns, func.count(Media.id).label("count"))
+                .join(Category, Category.id == Media.category_id)
+                .where(*filters)
+            )
+        
+        if db.get_bind().dialect.name == "sqlite":
+            # No GROUPING SETS on SQLite (local mode): the same rows from one
+            # GROUP BY per set, NULL in the columns the set doesn't group by
+            query = union_all(*(
+                facet_select([
+                    (column if name in grouping_set else null()).label(name)
+                    for name, column in grouped_columns.items()
+                ]).group_by(*(grouped_columns[name] for name in grouping_set))
+                for grouping_set in grouping_sets
+            ))
+        else:
+            query = facet_select([
+                column.label(name) for name, column in grouped_columns.items()
+            ]).group_by(
+                func.grouping_sets(*(
+                    tuple_(*(grouped_columns[name] for name in grouping_set))
+                    for grouping_set in grouping_sets
+                ))
+            )
+        
+        result = await db.execute(query)
+        
+        # The grouped columns are all NOT NULL, so the non-null ones tell which
+        # grouping set a row belongs to
+        categories, media_types, months = [], [], []
+        for row in result.all():
+            if row.category_id is not None:
+                categories.append({
+                    "category_id": row.category_id,
+                    "category_name": row.category_name,
+                    "count": row.count
+                })
+            elif row.media_type is not None:
+                media_types.append({"media_type": row.media_type, "count": row.count})
+            elif row.year is not None:
+                months.append({
+                    "month": f"{int(row.year):04d}-{int(row.month):02d}",
+                    "count": row.count
+                })
+        
+        facets = {
+            "categories": sorted(categories, key=lambda item: -item["count"]),
+            "media_types": sorted(media_types, key=lambda item: -item["count"]),
+            "months": sorted(months, key=lambda item: item["month"], reverse=True),
+            "total": sum(item["count"] for item in media_types)
+        }
+        
+        response_cache.set(cache_key, facets, version=version)
+        return facets
 
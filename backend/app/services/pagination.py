@@ -0,0 +1,193 @@
+import base64
+import json
+import math
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+@dataclass
+class Page:
+    """One page of ORM rows plus what's needed to build a PaginatedResponse"""
+    items: List[Any]
+    limit: int
+    skip: int = 0
+    total: Optional[int] = None  # None in cursor mode
+    next_cursor: Optional[str] = None
+    has_next: bool = False
+    has_previous: bool = False
+
+    def to_response(self, data: Optional[list] = None) -> dict:
+        """
+        PaginatedResponse fields for this page
+
+        In cursor mode nothing is counted, so total, page and total_pages are
+        None (unknown, not zero); clients follow next_cursor / has_next.
+
+        Args:
+            data: Serialized items (defaults to the ORM rows, for response_model conversion)
+        """
+        if self.total is None:
+            total = page = total_pages = None
+        else:
+            total = self.total
+            page = self.skip // self.limit + 1 if self.limit else 1
+            total_pages = math.ceil(total / self.limit) if self.limit else 0
+
+        return {
+            "success": True,
+            "data": self.items if data is None else data,
+            "total": total,
+            "page": page,
+            "limit": self.limit,
+            "total_pages": total_pages,
+            "has_next": self.has_next,
+            "has_previous": self.has_previous,
+            "next_cursor": self.next_cursor
+        }
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    skip: int = 0,
+    limit: int = 100
+) -> Page:
+    """
+    Fetch one offset page and the total row count in a single statement
+
+    COUNT(*) OVER() is evaluated after WHERE and before OFFSET/FETCH, so every
+    returned row carries the total of the filtered query. Only when the page
+    is empty (skip past the end) is a separate COUNT needed.
+
+    Args:
+        db: Database session
+        query: select() of one ORM entity with filters and ORDER BY applied
+        skip: Number of rows to skip
+        limit: Page size
+
+    Returns:
+        Page with items and total
+    """
+    result = await db.execute(
+        query.add_columns(func.count().over().label("total_count"))
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total_count
+    elif skip == 0:
+        total = 0
+    else:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = (await db.execute(count_query)).scalar_one()
+
+    return Page(
+        items=[row[0] for row in rows],
+        total=total,
+        skip=skip,
+        limit=limit,
+        has_next=skip + len(rows) < total,
+        has_previous=skip > 0
+    )
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(jsonable_encoder(list(values)), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, columns: Sequence[Any]) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except ValueError:
+        values = None
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+    decoded = []
+    for column, value in zip(columns, values):
+        python_type = column.type.python_type
+        if value is not None and python_type in (datetime, date):
+            value = python_type.fromisoformat(value)
+        decoded.append(value)
+    return decoded
+
+
+def _after_key(columns: Sequence[Any], values: Sequence[Any], descending: bool):
+    """
+    Keyset predicate "row comes after (values)" in ORDER BY columns order
+
+    Expanded to (a > x) OR (a = x AND b > y) ..., since SQL Server has no
+    row-value comparison.
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        equal = [columns[j] == values[j] for j in range(i)]
+        beyond = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
+
+
+async def paginate_cursor(
+    db: AsyncSession,
+    query: Select,
+    order_by: Sequence[Any],
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    descending: bool = False
+) -> Page:
+    """
+    Fetch one keyset (cursor) page
+
+    Seeks past the last row of the previous page instead of counting skipped
+    rows, so deep pages cost the same as the first. The last column of
+    `order_by` must be unique (e.g. the primary key) and the columns must not
+    be NULL. No total is computed.
+
+    Args:
+        db: Database session
+        query: select() of one ORM entity with filters applied (no ORDER BY)
+        order_by: Sort key columns of the entity
+        cursor: next_cursor of the previous page (None for the first page)
+        limit: Page size
+        descending: Sort every key column descending
+
+    Returns:
+        Page with items, has_next and next_cursor
+    """
+    if cursor:
+        query = query.where(_after_key(order_by, _decode_cursor(cursor, order_by), descending))
+
+    ordering = [column.desc() if descending else column.asc() for column in order_by]
+    result = await db.execute(query.order_by(*ordering).limit(limit + 1))
+    items = list(result.scalars().all())
+
+    has_next = len(items) > limit
+    items = items[:limit]
+
+    next_cursor = None
+    if has_next:
+        last = items[-1]
+        next_cursor = _encode_cursor([getattr(last, column.key) for column in order_by])
+
+    return Page(
+        items=items,
+        limit=limit,
+        next_cursor=next_cursor,
+        has_next=has_next,
+        has_previous=bool(cursor)
+    )
@@ -0,0 +1,237 @@
+import heapq
+import logging
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.media import Media
+from app.services.arabic_text import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+class MediaSearchIndex:
+    """
+    In-memory inverted index over active Media titles and descriptions
+
+    Terms are produced by app.services.arabic_text.tokenize (Arabic
+    normalization + light stemming) and ranked with BM25. Title terms are
+    weighted higher than description terms.
+
+    The index lives in the worker process: it is rebuilt at startup and kept
+    current by the media write paths (index_media / remove_media).
+    """
+
+    TITLE_WEIGHT = 3
+    DESCRIPTION_WEIGHT = 1
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        # term -> {media_id: weighted term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        # media_id -> stored fields returned with search results
+        self._docs: Dict[int, dict] = {}
+        # media_id -> {term: weighted term frequency} (needed to un-index)
+        self._doc_terms: Dict[int, Dict[str, int]] = {}
+        # media_id -> document length (sum of weighted term frequencies)
+        self._doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+        self.is_ready = False
+
+    # ========== Index maintenance ==========
+
+    @staticmethod
+    def _weighted_terms(title: str, description: Optional[str]) -> Dict[str, int]:
+        terms = Counter()
+        for term in tokenize(title or ""):
+            terms[term] += MediaSearchIndex.TITLE_WEIGHT
+        for term in tokenize(description or ""):
+            terms[term] += MediaSearchIndex.DESCRIPTION_WEIGHT
+        return dict(terms)
+
+    def index_document(
+        self,
+        media_id: int,
+        title: str,
+        description: Optional[str],
+        category_id: int,
+        media_type: str,
+        created_at: Optional[datetime],
+        is_active: bool = True
+    ) -> None:
+        """
+        Add or replace one media item in the index
+
+        Inactive media is removed instead (search only returns active media).
+        """
+        self.remove_media(media_id)
+
+        if not is_active:
+            return
+
+        terms = self._weighted_terms(title, description)
+
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[media_id] = frequency
+
+        self._doc_terms[media_id] = terms
+        self._doc_lengths[media_id] = sum(terms.values())
+        self._total_length += self._doc_lengths[media_id]
+        self._docs[media_id] = {
+            "id": media_id,
+            "title": title,
+            "description": description,
+            "category_id": category_id,
+            "media_type": media_type,
+            "created_at": created_at.isoformat() if created_at else None,
+        }
+
+    def index_media(self, media: Media) -> None:
+        """Add or replace a Media object in the index (call after commit)"""
+        self.index_document(
+            media_id=media.id,
+            title=media.title,
+            description=media.description,
+            category_id=media.category_id,
+            media_type=media.media_type,
+            created_at=media.created_at,
+            is_active=media.is_active
+        )
+
+    def remove_media(self, media_id: int) -> None:
+        """Remove a media item from the index (no-op if not indexed)"""
+        terms = self._doc_terms.pop(media_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(media_id, None)
+            if not posting:
+                del self._postings[term]
+
+        self._total_length -= self._doc_lengths.pop(media_id, 0)
+        self._docs.pop(media_id, None)
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Rebuild the whole index from the database
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of indexed media items
+        """
+        result = await db.execute(
+            select(
+                Media.id,
+                Media.title,
+                Media.description,
+                Media.category_id,
+                Media.media_type,
+                Media.created_at
+            ).where(Media.is_active == True)
+        )
+
+        self._postings = {}
+        self._docs = {}
+        self._doc_terms = {}
+        self._doc_lengths = {}
+        self._total_length = 0
+
+        for row in result.all():
+            self.index_document(
+                media_id=row.id,
+                title=row.title,
+                description=row.description,
+                category_id=row.category_id,
+                media_type=row.media_type,
+                created_at=row.created_at
+            )
+
+        self.is_ready = True
+        logger.info("Media search index built: %d items, %d terms", len(self._docs), len(self._postings))
+        return len(self._docs)
+
+    # ========== Querying ==========
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        category_id: Optional[int] = None,
+        media_type: Optional[str] = None
+    ) -> tuple[List[dict], int]:
+        """
+        Rank active media against a free-text query (BM25)
+
+        Args:
+            query: Search text (Arabic or Latin)
+            limit: Maximum results to return
+            offset: Number of ranked results to skip
+            category_id: Optional category filter
+            media_type: Optional media type filter
+
+        Returns:
+            Tuple of (results with "score", total number of matches)
+        """
+        terms = set(tokenize(query))
+        doc_count = len(self._docs)
+
+        # Every indexed title may be stop words only (total length 0): nothing
+        # can match, and the length normalization below would divide by zero
+        if not terms or doc_count == 0 or self._total_length == 0:
+            return [], 0
+
+        avg_length = self._total_length / doc_count
+        k1, b = self.K1, self.B
+        doc_lengths = self._doc_lengths
+        docs = self._docs
+        filtered = category_id is not None or media_type is not None
+        base_norm = k1 * (1 - b)
+        length_factor = k1 * b / avg_length
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+
+            idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+
+            for media_id, frequency in posting.items():
+                if filtered:
+                    doc = docs[media_id]
+                    if category_id is not None and doc["category_id"] != category_id:
+                        continue
+                    if media_type is not None and doc["media_type"] != media_type:
+                        continue
+
+                norm = base_norm + length_factor * doc_lengths[media_id]
+                scores[media_id] = scores.get(media_id, 0.0) + idf * frequency * (k1 + 1) / (frequency + norm)
+
+        total = len(scores)
+        # Ties go to the newest media (higher id)
+        ranked = heapq.nlargest(offset + limit, scores.items(), key=lambda item: (item[1], item[0]))[offset:]
+
+        results = [
+            {**self._docs[media_id], "score": round(score, 4)}
+            for media_id, score in ranked
+        ]
+
+        return results, total
+
+
+# Process-wide index used by routes and write paths
+media_search_index = MediaSearchIndex()
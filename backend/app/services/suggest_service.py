@@ -0,0 +1,207 @@
+import bisect
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.categories import Category
+from app.models.media import Media
+from app.services.arabic_text import tokenize
+
+logger = logging.getLogger(__name__)
+
+# (recency timestamp, kind, id) - lists of these stay sorted oldest -> newest
+_SortKey = Tuple[float, str, int]
+
+
+class TitleSuggestIndex:
+    """
+    In-memory edge n-gram index for typeahead suggestions
+
+    Every word of an active media title / category name is indexed under its
+    prefixes (MIN_PREFIX..MAX_PREFIX normalized characters). Each prefix maps
+    to a list of entries kept sorted by recency, so a query walks the shortest
+    matching list from the newest end and stops after `limit` hits.
+
+    Built at startup and kept current by the upload and category write paths.
+    """
+
+    MIN_PREFIX = 2
+    MAX_PREFIX = 6
+
+    MEDIA = "media"
+    CATEGORY = "category"
+
+    def __init__(self):
+        # prefix -> sorted list of entry sort keys
+        self._prefixes: Dict[str, List[_SortKey]] = {}
+        # (kind, id) -> entry
+        self._entries: Dict[Tuple[str, int], dict] = {}
+        self.is_ready = False
+
+    @staticmethod
+    def _words(text: str) -> List[str]:
+        return tokenize(text, stem=False)
+
+    @classmethod
+    def _word_prefixes(cls, words: List[str]) -> set:
+        prefixes = set()
+        for word in words:
+            for size in range(cls.MIN_PREFIX, min(len(word), cls.MAX_PREFIX) + 1):
+                prefixes.add(word[:size])
+        return prefixes
+
+    # ========== Index maintenance ==========
+
+    def add(
+        self,
+        kind: str,
+        entry_id: int,
+        text: str,
+        created_at: Optional[datetime],
+        category_id: Optional[int] = None
+    ) -> None:
+        """Add or replace one suggestion entry"""
+        self.remove(kind, entry_id)
+
+        words = self._words(text)
+        if not words:
+            return
+
+        sort_key = (created_at.timestamp() if created_at else 0.0, kind, entry_id)
+
+        self._entries[(kind, entry_id)] = {
+            "type": kind,
+            "id": entry_id,
+            "text": text,
+            "category_id": category_id,
+            "words": words,
+            "sort_key": sort_key,
+        }
+
+        for prefix in self._word_prefixes(words):
+            bisect.insort(self._prefixes.setdefault(prefix, []), sort_key)
+
+    def remove(self, kind: str, entry_id: int) -> None:
+        """Remove one suggestion entry (no-op if missing)"""
+        entry = self._entries.pop((kind, entry_id), None)
+        if entry is None:
+            return
+
+        sort_key = entry["sort_key"]
+        for prefix in self._word_prefixes(entry["words"]):
+            keys = self._prefixes.get(prefix)
+            if not keys:
+                continue
+            position = bisect.bisect_left(keys, sort_key)
+            if position < len(keys) and keys[position] == sort_key:
+                del keys[position]
+            if not keys:
+                del self._prefixes[prefix]
+
+    def index_media(self, media: Media) -> None:
+        """Add or replace a media title (inactive media is removed)"""
+        if not media.is_active:
+            self.remove(self.MEDIA, media.id)
+            return
+        self.add(self.MEDIA, media.id, media.title, media.created_at, media.category_id)
+
+    def index_category(self, category: Category) -> None:
+        """Add or replace a category name (inactive categories are removed)"""
+        if not category.is_active:
+            self.remove(self.CATEGORY, category.id)
+            return
+        self.add(self.CATEGORY, category.id, category.category_name, category.created_at, category.id)
+
+    async def rebuild(self, db: AsyncSession) -> int:
+        """
+        Rebuild the index from active media titles and category names
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of indexed entries
+        """
+        media_result = await db.execute(
+            select(Media.id, Media.title, Media.category_id, Media.created_at)
+            .where(Media.is_active == True)
+            .order_by(Media.created_at)  # oldest first -> insort appends at the end
+        )
+        category_result = await db.execute(
+            select(Category.id, Category.category_name, Category.created_at)
+            .where(Category.is_active == True)
+        )
+
+        self._prefixes = {}
+        self._entries = {}
+
+        for row in media_result.all():
+            self.add(self.MEDIA, row.id, row.title, row.created_at, row.category_id)
+        for row in category_result.all():
+            self.add(self.CATEGORY, row.id, row.category_name, row.created_at, row.id)
+
+        self.is_ready = True
+        logger.info("Suggest index built: %d entries, %d prefixes", len(self._entries), len(self._prefixes))
+        return len(self._entries)
+
+    # ========== Querying ==========
+
+    def suggest(
+        self,
+        query: str,
+        limit: int = 10,
+        kind: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Return the newest entries whose words start with every query word
+
+        Args:
+            query: Partial text typed by the user
+            limit: Maximum suggestions to return
+            kind: Optional filter - "media" or "category"
+
+        Returns:
+            List of suggestions, newest first
+        """
+        words = self._words(query)
+        if not words or any(len(word) < self.MIN_PREFIX for word in words):
+            return []
+
+        # Walk the shortest candidate list; other words are verified per entry
+        candidate_lists = []
+        for word in words:
+            keys = self._prefixes.get(word[:self.MAX_PREFIX])
+            if not keys:
+                return []
+            candidate_lists.append(keys)
+        candidates = min(candidate_lists, key=len)
+
+        suggestions = []
+        for sort_key in reversed(candidates):
+            if kind is not None and sort_key[1] != kind:
+                continue
+
+            entry = self._entries[(sort_key[1], sort_key[2])]
+            if not all(
+                any(entry_word.startswith(word) for entry_word in entry["words"])
+                for word in words
+            ):
+                continue
+
+            suggestions.append({
+                "type": entry["type"],
+                "id": entry["id"],
+                "text": entry["text"],
+                "category_id": entry["category_id"],
+            })
+            if len(suggestions) >= limit:
+                break
+
+        return suggestions
+
+
+# Process-wide index used by routes and write paths
+title_suggest_index = TitleSuggestIndex()
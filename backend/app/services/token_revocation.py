@@ -0,0 +1,188 @@
+import asyncio
+import hashlib
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import Optional, Set
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.config import settings
+from app.database.database import AsyncSessionLocal
+from app.models.revoked_token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(jti: str) -> int:
+    """64-bit digest of a token id (what the filter and the exact set store)"""
+    return int.from_bytes(hashlib.blake2b(jti.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit digests (double hashing)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: int):
+        low = digest & 0xFFFFFFFF
+        high = (digest >> 32) | 1
+        for i in range(self.hash_count):
+            yield (low + i * high) % self.size
+
+    def add(self, digest: int) -> None:
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, digest: int) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class RevocationList:
+    """
+    In-memory view of RevokedTokens for per-request checks
+
+    A Bloom filter answers "definitely not revoked" for almost every token
+    without touching the exact set; the set of 64-bit digests confirms the
+    rare positives. Both are filled from the table at startup and then
+    synced incrementally (by id) every TOKEN_REVOCATION_SYNC_SECONDS, which
+    is how revocations made by other workers arrive. Revocations made in
+    this process apply immediately.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001, sync_seconds: float = 30.0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._exact: Set[int] = set()
+        self._last_id = 0
+        self._task = None
+
+    @property
+    def size(self) -> int:
+        return len(self._exact)
+
+    def _add(self, jti: str) -> None:
+        digest = _digest(jti)
+        if digest in self._exact:
+            return
+        self._exact.add(digest)
+        self._bloom.add(digest)
+
+    def is_revoked(self, jti: str) -> bool:
+        """O(1) check, no database access"""
+        digest = _digest(jti)
+        return digest in self._bloom and digest in self._exact
+
+    async def load(self, db: AsyncSession) -> int:
+        """
+        Rebuild from the table (unexpired rows only), purging expired rows
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of revoked tokens held
+        """
+        now = datetime.utcnow()
+        await db.execute(delete(RevokedToken).where(RevokedToken.expires_at < now))
+        await db.commit()
+
+        result = await db.execute(
+            select(RevokedToken.id, RevokedToken.jti).where(RevokedToken.expires_at >= now)
+        )
+        rows = result.all()
+
+        # Size the filter for the current list plus headroom
+        self._bloom = BloomFilter(max(self.capacity, len(rows) * 2), self.error_rate)
+        self._exact = set()
+        for row in rows:
+            self._add(row.jti)
+        self._last_id = max((row.id for row in rows), default=self._last_id)
+
+        logger.info(f"Token revocation list loaded: {len(self._exact)} tokens")
+        return len(self._exact)
+
+    async def sync(self, db: AsyncSession) -> int:
+        """Add rows revoked since the last load / sync; returns how many were read"""
+        # Also re-read recent rows: an id allocated by a transaction that
+        # committed after a later id was synced would otherwise be skipped
+        lookback = datetime.utcnow() - timedelta(seconds=max(2 * self.sync_seconds, 60))
+        result = await db.execute(
+            select(RevokedToken.id, RevokedToken.jti)
+            .where(or_(RevokedToken.id > self._last_id, RevokedToken.revoked_at >= lookback))
+            .order_by(RevokedToken.id.asc())
+        )
+        rows = result.all()
+        for row in rows:
+            self._add(row.jti)
+            self._last_id = max(self._last_id, row.id)
+
+        if self._bloom.count > self._bloom.capacity:
+            await self.load(db)  # Keep the false-positive rate at its target
+        return len(rows)
+
+    async def revoke(
+        self,
+        db: AsyncSession,
+        jti: str,
+        expires_at: datetime,
+        user_id: Optional[int] = None
+    ) -> None:
+        """
+        Revoke a token id until its expiry
+
+        Args:
+            db: Database session
+            jti: Token id (jti claim)
+            expires_at: Token expiry (exp claim); the row can be purged afterwards
+            user_id: Owner, for auditing
+        """
+        if not self.is_revoked(jti):
+            db.add(RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Another worker (or a concurrent logout) revoked it first and
+                # this process hasn't synced yet: already revoked, same result
+                await db.rollback()
+        self._add(jti)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_seconds)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.sync(db)
+            except Exception as e:
+                logger.warning(f"Token revocation sync failed: {e}")
+
+    def start(self) -> None:
+        """Start periodic sync (called from lifespan)"""
+        if self._task is None and self.sync_seconds > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Process-wide revocation list checked by get_current_user
+revocation_list = RevocationList(
+    capacity=settings.TOKEN_REVOCATION_CAPACITY,
+    sync_seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS
+)
@@ -0,0 +1,119 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.config import settings
+from app.models.users import User
+
+# Columns kept in the cache (the password hash stays in the database)
+_CACHED_COLUMNS = tuple(
+    column.key for column in User.__table__.columns if column.key != "password"
+)
+
+
+class UserCache:
+    """
+    TTL-bounded cache of authenticated users, keyed by user id
+
+    Stores plain column snapshots and hands out a fresh detached User per hit,
+    so request handlers can't mutate the shared copy. Entries are dropped
+    immediately by the user write paths in this process (UserService,
+    login); the TTL bounds staleness for writes made by other workers.
+
+    invalidate() also remembers when each user was last written, so tokens
+    issued before that write aren't trusted for their claims
+    (AUTH_TRUST_TOKEN_CLAIMS) and the user is read from the database instead.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[float, Dict]]" = OrderedDict()
+        # user id -> epoch seconds of the last write, oldest first
+        self._written: "OrderedDict[int, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[User]:
+        """Cached user (detached copy) or None if missing / expired"""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return User(**entry[1])
+
+    def set(self, user: User) -> None:
+        """Cache a user loaded from the database"""
+        if self.ttl_seconds <= 0:
+            return
+
+        snapshot = {key: getattr(user, key) for key in _CACHED_COLUMNS}
+        self._entries[user.id] = (time.monotonic() + self.ttl_seconds, snapshot)
+        self._entries.move_to_end(user.id)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop one user (after update, password change, delete, role change)"""
+        self._entries.pop(user_id, None)
+
+        self._written[user_id] = time.time()
+        self._written.move_to_end(user_id)
+        while len(self._written) > self.max_entries:
+            self._written.popitem(last=False)
+
+    def written_since(self, user_id: int, issued_at: Optional[float]) -> bool:
+        """
+        True if this process wrote the user at or after issued_at
+
+        Args:
+            user_id: User ID
+            issued_at: Token "iat" claim (None for tokens without one)
+
+        Returns:
+            Whether the token's claims may be stale
+        """
+        written = self._written.get(user_id)
+        if written is None:
+            return False
+        return issued_at is None or issued_at <= written
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def load(self, db: AsyncSession, user_id: int) -> Optional[User]:
+        """
+        Get a user from the cache, falling back to the database
+
+        Args:
+            db: Database session (only used on a miss)
+            user_id: User ID
+
+        Returns:
+            User or None if it doesn't exist
+        """
+        user = self.get(user_id)
+        if user is not None:
+            return user
+
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            self.set(user)
+        return user
+
+
+# Process-wide user cache used by get_current_user
+user_cache = UserCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES
+)
@@ -1,17 +1,27 @@
 
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from fastapi import HTTPException, status
 
+from app.database.types import utcnow
 from app.models.users import User
 from app.schemas.user import UserUpdate, UserResponse
-from app.Authentication.password import hash_password, verify_password
+from app.Authentication.password import password_hasher
+from app.services.pagination import Page, paginate, paginate_cursor
+from app.services.user_cache import user_cache
+from app.services.category_cache import category_cache
 
 
 class UserService:
     """Service for user management operations"""
     
+    @staticmethod
+    def _after_write(user_id: int) -> None:
+        """Drop cached copies of a user after a committed write"""
+        user_cache.invalidate(user_id)
+        category_cache.invalidate()  # Category details embed the creator
+    
     @staticmethod
     async def get_user_by_id(
         db: AsyncSession,
@@ -31,10 +41,37 @@ class UserService:
     ) -> List[User]:
         """Get all users with pagination"""
         result = await db.execute(
-            select(User).offset(skip).limit(limit)
+            select(User).order_by(User.id.asc()).offset(skip).limit(limit)
         )
         return list(result.scalars().all())
     
+    @staticmethod
+    async def get_users_page(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page:
+        """
+        Get one page of users (ordered by id)
+        
+        Offset mode returns the total from the same query (COUNT(*) OVER());
+        cursor mode seeks by id and counts nothing.
+        
+        Args:
+            db: Database session
+            skip: Number of records to skip (offset mode)
+            limit: Maximum number of records to return
+            cursor: next_cursor of the previous page, "" for the first page (cursor mode, no total)
+            
+        Returns:
+            Page of User objects
+        """
+        if cursor is not None:
+            return await paginate_cursor(db, select(User), order_by=(User.id,), cursor=cursor, limit=limit)
+        
+        return await paginate(db, select(User).order_by(User.id.asc()), skip=skip, limit=limit)
+    
     @staticmethod
     async def update_user(
         db: AsyncSession,
@@ -73,15 +110,18 @@ class UserService:
         for field, value in update_data.items():
             if field == 'password' and value:
                 # Hash password if being updated
-                setattr(user, field, hash_password(value))
+                setattr(user, field, await password_hasher.hash(value))
             elif hasattr(user, field):
                 setattr(user, field, value)
         
-        user.updated_at = func.getutcdate()
+        user.updated_at = utcnow()
         
         await db.commit()
         await db.refresh(user)
         
+        # Username / permission / role / is_active may have changed
+        UserService._after_write(user_id)
+        
         return user
     
     @staticmethod
@@ -115,17 +155,18 @@ class UserService:
             )
         
         # Verify old password
-        if not verify_password(old_password, user.password):
+        if not await password_hasher.verify(old_password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect old password"
             )
         
         # Update password
-        user.password = hash_password(new_password)
-        user.updated_at = func.getutcdate()
+        user.password = await password_hasher.hash(new_password)
+        user.updated_at = utcnow()
         
         await db.commit()
+        UserService._after_write(user_id)
         
         return True
     
@@ -158,7 +199,9 @@ class UserService:
             await db.delete(user)
         else:
             user.is_active = False
-            user.updated_at = func.getutcdate()
+            user.updated_at = utcnow()
         
         await db.commit()
+        UserService._after_write(user_id)
+        
         return True
\ No newline at end of file
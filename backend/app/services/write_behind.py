@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import bindparam, column, func, update, values
+
+from app.database.config import settings
+from app.database.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# SQL Server allows 2100 parameters per statement; each row binds two
+_ROWS_PER_STATEMENT = 1000
+
+_SET = "set"
+_ADD = "add"
+
+
+class WriteBehindBuffer:
+    """
+    Collects low-value row updates in memory and writes them in batches
+
+    Meant for hot, loss-tolerant columns such as Users.last_login or view
+    counters: the request path only records the change, and a background
+    task periodically applies everything collected for a column with one
+    UPDATE ... FROM (VALUES ...) statement. Pending changes are flushed on
+    shutdown; a crash loses at most one flush interval.
+
+    set_value() keeps the latest value per row, increment() sums deltas.
+    """
+
+    def __init__(self, flush_seconds: float = 5.0, max_pending: int = 10000):
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+        # (model, column name, mode) -> {row id: value}
+        self._pending: Dict[Tuple[Any, str, str], Dict[Any, Any]] = {}
+        self._task = None
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(rows) for rows in self._pending.values())
+
+    def _record(self, key: Tuple[Any, str, str], row_id: Any, value: Any) -> None:
+        rows = self._pending.setdefault(key, {})
+        if key[2] == _ADD:
+            rows[row_id] = rows.get(row_id, 0) + value
+        else:
+            rows[row_id] = value
+
+        if self.pending_count >= self.max_pending:
+            self._wakeup.set()
+
+    def set_value(self, model, column_name: str, row_id: Any, value: Any) -> None:
+        """Queue `UPDATE model SET column = value WHERE id = row_id` (last value wins)"""
+        self._record((model, column_name, _SET), row_id, value)
+
+    def increment(self, model, column_name: str, row_id: Any, delta: int = 1) -> None:
+        """Queue `UPDATE model SET column = column + delta WHERE id = row_id`"""
+        self._record((model, column_name, _ADD), row_id, delta)
+
+    @staticmethod
+    def _statement(model, column_name: str, mode: str, rows: list):
+        target = getattr(model, column_name)
+        batch = values(
+            column("row_id", model.id.type),
+            column("new_value", target.type),
+            name="pending"
+        ).data(rows)
+
+        if mode == _ADD:
+            new_value = func.coalesce(target, 0) + batch.c.new_value
+        else:
+            new_value = batch.c.new_value
+
+        return (
+            update(model)
+            .where(model.id == batch.c.row_id)
+            .values({column_name: new_value})
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _row_statement(model, column_name: str, mode: str):
+        # SQLite (local mode) can't alias VALUES columns; same update, executemany
+        table = model.__table__
+        target = table.c[column_name]
+        new_value = bindparam("new_value", type_=target.type)
+        if mode == _ADD:
+            new_value = func.coalesce(target, 0) + new_value
+        return update(table).where(table.c.id == bindparam("row_id")).values({column_name: new_value})
+
+    async def flush(self) -> int:
+        """
+        Write every pending change (one statement per column and 1000 rows)
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            written = 0
+            try:
+                async with AsyncSessionLocal() as db:
+                    use_values = db.get_bind().dialect.name != "sqlite"
+                    for (model, column_name, mode), rows in pending.items():
+                        items = list(rows.items())
+                        for start in range(0, len(items), _ROWS_PER_STATEMENT):
+                            chunk = items[start:start + _ROWS_PER_STATEMENT]
+                            if use_values:
+                                await db.execute(self._statement(model, column_name, mode, chunk))
+                            else:
+                                await db.execute(
+                                    self._row_statement(model, column_name, mode),
+                                    [{"row_id": row_id, "new_value": value} for row_id, value in chunk]
+                                )
+                            written += len(chunk)
+                    await db.commit()
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.error(f"Write-behind flush failed, keeping {sum(map(len, pending.values()))} updates: {e}")
+                self._requeue(pending)
+                return 0
+
+            self.flushed_rows += written
+            return written
+
+    def _requeue(self, pending: Dict[Tuple[Any, str, str], Dict[Any, Any]]) -> None:
+        # Changes recorded since the failed flush are newer and win for set_value
+        for key, rows in pending.items():
+            for row_id, value in rows.items():
+                current = self._pending.setdefault(key, {})
+                if key[2] == _ADD:
+                    current[row_id] = current.get(row_id, 0) + value
+                else:
+                    current.setdefault(row_id, value)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the periodic flush task (called from lifespan)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write what's left (called on shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        written = await self.flush()
+        if written:
+            logger.info(f"Write-behind buffer flushed {written} rows on shutdown")
+
+
+# Process-wide buffer (Users.last_login, counters)
+write_behind = WriteBehindBuffer(
+    flush_seconds=settings.WRITE_BEHIND_FLUSH_SECONDS,
+    max_pending=settings.WRITE_BEHIND_MAX_PENDING
+)
@@ -0,0 +1,47 @@
+-- =====================================================================
+-- 001 - Covering / filtered indexes for the current-month media queries
+-- =====================================================================
+-- Target: SQL Server (existing databases created before these indexes were
+-- declared in app/models/media.py and app/models/media_path.py).
+-- Safe to run more than once: every index is created only if missing.
+--
+-- Access paths served:
+--   * WHERE is_active = 1 AND created_at BETWEEN ... ORDER BY created_at DESC
+--   * ... AND category_id = ?
+--   * ... AND media_type = ?
+--   * selectinload(Media.paths) -> WHERE media_id IN (...) (primary file first)
+-- =====================================================================
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_Media_active_created_at' AND object_id = OBJECT_ID('dbo.Media')
+)
+    CREATE INDEX [IX_Media_active_created_at] ON [dbo].[Media] (created_at DESC)
+        INCLUDE (title, description, category_id, user_id, media_type, is_active, updated_at, updated_by)
+        WHERE is_active = 1;
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_Media_active_category_created_at' AND object_id = OBJECT_ID('dbo.Media')
+)
+    CREATE INDEX [IX_Media_active_category_created_at] ON [dbo].[Media] (category_id, created_at DESC)
+        INCLUDE (title, description, user_id, media_type, is_active, updated_at, updated_by)
+        WHERE is_active = 1;
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_Media_active_type_created_at' AND object_id = OBJECT_ID('dbo.Media')
+)
+    CREATE INDEX [IX_Media_active_type_created_at] ON [dbo].[Media] (media_type, created_at DESC)
+        INCLUDE (title, description, category_id, user_id, is_active, updated_at, updated_by)
+        WHERE is_active = 1;
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_MediaPaths_media_primary_sort' AND object_id = OBJECT_ID('dbo.MediaPaths')
+)
+    CREATE INDEX [IX_MediaPaths_media_primary_sort] ON [dbo].[MediaPaths] (media_id, is_primary, sort_order);
+GO
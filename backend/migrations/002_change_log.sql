@@ -0,0 +1,23 @@
+-- =====================================================================
+-- 002 - ChangeLog table for the /api/changes delta-sync feed
+-- =====================================================================
+-- Target: SQL Server (existing databases; DEVELOPMENT mode creates it via
+-- create_all). Safe to run more than once.
+-- =====================================================================
+
+IF OBJECT_ID('dbo.ChangeLog', 'U') IS NULL
+    CREATE TABLE [dbo].[ChangeLog] (
+        [id] BIGINT IDENTITY(1,1) NOT NULL PRIMARY KEY,
+        [entity_type] VARCHAR(20) NOT NULL,
+        [entity_id] BIGINT NOT NULL,
+        [action] VARCHAR(20) NOT NULL,
+        [changed_at] DATETIME NOT NULL DEFAULT (getutcdate())
+    );
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_ChangeLog_entity' AND object_id = OBJECT_ID('dbo.ChangeLog')
+)
+    CREATE INDEX [IX_ChangeLog_entity] ON [dbo].[ChangeLog] (entity_type, entity_id);
+GO
@@ -0,0 +1,48 @@
+-- =====================================================================
+-- 003 - Users.username_key: normalized username for index-seek lookups
+-- =====================================================================
+-- Target: SQL Server (existing databases; DEVELOPMENT mode creates it via
+-- create_all). Safe to run more than once.
+--
+-- The application keeps username_key = lower(trim(username)) on every write
+-- (User._sync_username_key); this script adds the column, backfills
+-- existing rows the same way and makes it unique.
+-- =====================================================================
+
+IF COL_LENGTH('dbo.Users', 'username_key') IS NULL
+    ALTER TABLE [dbo].[Users] ADD [username_key] VARCHAR(50) NULL;
+GO
+
+UPDATE [dbo].[Users]
+SET [username_key] = LOWER(LTRIM(RTRIM([username])))
+WHERE [username_key] IS NULL
+   OR [username_key] <> LOWER(LTRIM(RTRIM([username])));
+GO
+
+-- Pre-check: usernames that normalize to the same key (e.g. "Alice" and
+-- "alice ") would make CREATE UNIQUE INDEX below fail. Lists them and
+-- raises an error; rename or merge those rows, then re-run the script.
+SELECT [username_key], COUNT(*) AS [users]
+FROM [dbo].[Users]
+GROUP BY [username_key]
+HAVING COUNT(*) > 1;
+
+IF EXISTS (
+    SELECT 1 FROM [dbo].[Users]
+    GROUP BY [username_key]
+    HAVING COUNT(*) > 1
+)
+    RAISERROR('Users.username_key has duplicates (listed above); resolve them before creating UX_Users_username_key.', 16, 1);
+GO
+
+IF COLUMNPROPERTY(OBJECT_ID('dbo.Users'), 'username_key', 'AllowsNull') = 1
+    ALTER TABLE [dbo].[Users] ALTER COLUMN [username_key] VARCHAR(50) NOT NULL;
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'UX_Users_username_key' AND object_id = OBJECT_ID('dbo.Users')
+)
+    -- Fails if two usernames normalize to the same key (see the pre-check above)
+    CREATE UNIQUE INDEX [UX_Users_username_key] ON [dbo].[Users] ([username_key]);
+GO
@@ -0,0 +1,23 @@
+-- =====================================================================
+-- 004 - RevokedTokens table (JWT revocation on logout)
+-- =====================================================================
+-- Target: SQL Server (existing databases; DEVELOPMENT mode creates it via
+-- create_all). Safe to run more than once.
+-- =====================================================================
+
+IF OBJECT_ID('dbo.RevokedTokens', 'U') IS NULL
+    CREATE TABLE [dbo].[RevokedTokens] (
+        [id] BIGINT IDENTITY(1,1) NOT NULL PRIMARY KEY,
+        [jti] VARCHAR(64) NOT NULL UNIQUE,
+        [user_id] INT NULL,
+        [expires_at] DATETIME NOT NULL,
+        [revoked_at] DATETIME NOT NULL DEFAULT (getutcdate())
+    );
+GO
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_RevokedTokens_expires_at' AND object_id = OBJECT_ID('dbo.RevokedTokens')
+)
+    CREATE INDEX [IX_RevokedTokens_expires_at] ON [dbo].[RevokedTokens] (expires_at);
+GO